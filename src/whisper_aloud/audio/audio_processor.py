@@ -1,10 +1,16 @@
 """Audio processing utilities."""
 
+import functools
 import logging
-from typing import Tuple
+import math
+import os
+from typing import Optional, Tuple
 
 import numpy as np
+import scipy.fft
 from scipy import signal
+from scipy.fft import next_fast_len
+from scipy.ndimage import uniform_filter1d
 
 from ..config import AudioProcessingConfig
 from ..exceptions import AudioProcessingError
@@ -12,6 +18,30 @@ from ..exceptions import AudioProcessingError
 logger = logging.getLogger(__name__)
 
 
+def _peak_abs(audio: np.ndarray) -> float:
+    """Return max(|audio|) using two read-only reductions instead of an |audio| temporary."""
+    return max(float(audio.max()), -float(audio.min()))
+
+
+@functools.lru_cache(maxsize=None)
+def _pyfftw_backend():
+    """Return pyFFTW's scipy.fft backend if installed (optional dependency), else None.
+
+    pyFFTW can split a single large 1-D transform across threads, which
+    scipy's built-in pocketfft does not (its ``workers`` only parallelise
+    batches of transforms). Plans are cached by pyFFTW's interface cache.
+    """
+    try:
+        import pyfftw
+        import pyfftw.interfaces.scipy_fft as backend
+    except ImportError:
+        return None
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    pyfftw.interfaces.cache.enable()
+    logger.info("Using pyFFTW for resampling")
+    return backend
+
+
 class NoiseGate:
     """Noise gate with smooth attack/release, hysteresis, and hold time."""
 
@@ -46,6 +76,32 @@ class NoiseGate:
         self._envelope = 0.0
         self._gate_open = False
         self._hold_remaining = 0  # samples left in hold period
+        self._coeff_key: Optional[tuple] = None
+        self._coeffs: Optional[tuple] = None
+
+    def _coefficients(self, sample_rate: int) -> tuple:
+        """Return the gate's derived constants for ``sample_rate``.
+
+        They depend only on the constructor parameters and the sample rate,
+        so they are computed once and reused across chunks. The cache key
+        includes the parameters, so assigning a new threshold or time
+        constant simply triggers a recompute on the next call.
+        """
+        key = (sample_rate, self.threshold_db, self.hysteresis_db,
+               self.hold_ms, self.attack_ms, self.release_ms)
+        if key != self._coeff_key:
+            release_samples = max(1.0, self.release_ms * sample_rate / 1000.0)
+            self._coeffs = (
+                10 ** (self.threshold_db / 20.0),                           # open threshold
+                10 ** ((self.threshold_db - self.hysteresis_db) / 20.0),    # close threshold
+                int(self.hold_ms * sample_rate / 1000.0),                   # hold samples
+                math.exp(-1.0 / release_samples),                           # release coeff
+                1.0 / max(1, int(self.attack_ms * sample_rate / 1000.0)),   # attack step
+                max(2, int(sample_rate * 0.025)),                           # RMS window
+                max(1, int(sample_rate * 0.010)),                           # gate block size
+            )
+            self._coeff_key = key
+        return self._coeffs
 
     def process(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
         """Apply noise gate to audio chunk.
@@ -56,29 +112,26 @@ class NoiseGate:
         if audio.size == 0:
             return audio
 
-        open_threshold = 10 ** (self.threshold_db / 20.0)
-        close_threshold = 10 ** ((self.threshold_db - self.hysteresis_db) / 20.0)
-        hold_samples = int(self.hold_ms * sample_rate / 1000.0)
-        release_samples = max(1.0, self.release_ms * sample_rate / 1000.0)
-        release_coeff = np.exp(-1.0 / release_samples)
+        (open_threshold, close_threshold, hold_samples, release_coeff,
+         attack_step, win, block_size) = self._coefficients(sample_rate)
 
         n = len(audio)
 
         # Step 1: Compute per-sample RMS level using a 25ms sliding window
         # to smooth over waveform zero-crossings (was 2ms — too short for speech).
-        win = min(max(2, int(sample_rate * 0.025)), n)
-        sq = audio.astype(np.float64) ** 2
-        cumsum = np.cumsum(sq)
-        rms = np.empty(n, dtype=np.float64)
-        if n <= win:
-            rms[:] = np.sqrt(cumsum / np.arange(1, n + 1))
-        else:
-            rms[:win] = np.sqrt(cumsum[:win] / np.arange(1, win + 1))
-            rms[win:] = np.sqrt((cumsum[win:] - cumsum[:-win]) / win)
+        # Stays in float32: uniform_filter1d keeps its running sum in double,
+        # so unlike a float32 cumsum difference it does not lose precision on
+        # long recordings. The window trails each sample; over the first `win`
+        # samples the zero-padded mean is rescaled to the mean of what exists.
+        win = min(win, n)
+        sq = np.square(audio, dtype=np.float32)
+        rms = uniform_filter1d(sq, win, mode='constant', origin=(win - 1) // 2)
+        rms[:win] *= win / np.arange(1, win + 1, dtype=np.float32)
+        np.maximum(rms, 0.0, out=rms)  # running-sum rounding can dip below zero
+        np.sqrt(rms, out=rms)
 
         # Step 2: Compute gate state with hysteresis + hold in 10ms blocks.
         # This avoids a per-sample Python loop while handling stateful hold logic.
-        block_size = max(1, int(sample_rate * 0.010))
         gate_state = np.empty(n, dtype=bool)
         gate_open = self._gate_open
         hold_remaining = self._hold_remaining
@@ -105,29 +158,32 @@ class NoiseGate:
         self._hold_remaining = hold_remaining
 
         # Step 3: Apply smooth attack/release envelope using vectorized segment processing.
-        attack_step = 1.0 / max(1, int(self.attack_ms * sample_rate / 1000.0))
         envelope = self._envelope
-        gain = np.empty(n, dtype=np.float64)
+        gain = np.empty(n, dtype=np.float32)
 
         changes = np.diff(gate_state.astype(np.int8))
         seg_starts = np.concatenate(([0], np.nonzero(changes)[0] + 1, [n]))
+        # One 1..N step ramp shared by every segment instead of an arange each
+        steps = np.arange(1, int(np.diff(seg_starts).max()) + 1, dtype=np.float64)
 
         for seg_idx in range(len(seg_starts) - 1):
             start = seg_starts[seg_idx]
             end = seg_starts[seg_idx + 1]
-            seg_len = end - start
+            seg_steps = steps[:end - start]
 
             if gate_state[start]:
-                ramp = envelope + attack_step * np.arange(1, seg_len + 1)
-                np.clip(ramp, 0.0, 1.0, out=ramp)
+                # envelope >= 0 and attack_step > 0, so only the upper bound can bind
+                ramp = envelope + attack_step * seg_steps
+                np.minimum(ramp, 1.0, out=ramp)
                 gain[start:end] = ramp
                 envelope = ramp[-1]
             else:
-                decay_factors = release_coeff ** np.arange(1, seg_len + 1)
-                gain[start:end] = envelope * decay_factors
+                gain[start:end] = envelope * np.power(release_coeff, seg_steps)
                 envelope = gain[end - 1]
 
         self._envelope = float(envelope)
+        if audio.dtype == np.float32:
+            return np.multiply(audio, gain, out=gain)
         return (audio * gain).astype(audio.dtype)
 
 
@@ -295,13 +351,19 @@ class AudioProcessor:
     """Audio processing operations."""
 
     @staticmethod
-    def normalize(audio: np.ndarray, target_level: float = 0.95) -> np.ndarray:
+    def normalize(
+        audio: np.ndarray,
+        target_level: float = 0.95,
+        in_place: bool = False,
+    ) -> np.ndarray:
         """
         Normalize audio to target peak level.
 
         Args:
             audio: Input audio array
             target_level: Target peak level (0.0 to 1.0)
+            in_place: Scale ``audio`` itself instead of allocating a new array.
+                Only safe when the caller owns the buffer.
 
         Returns:
             Normalized audio array
@@ -309,8 +371,10 @@ class AudioProcessor:
         if audio.size == 0:
             return audio
 
-        peak = np.max(np.abs(audio))
+        peak = _peak_abs(audio)
         if peak > 0:
+            if in_place:
+                return np.multiply(audio, target_level / peak, out=audio)
             return audio * (target_level / peak)
         return audio
 
@@ -338,6 +402,14 @@ class AudioProcessor:
         """
         Resample audio to target sample rate.
 
+        The FFT resampler is O(N log N) only when both the input and output
+        lengths factor into small primes; a prime length (common for arbitrary
+        recording lengths) degrades to a pathologically slow transform. The
+        input is therefore zero-padded so that both FFT sizes are "fast"
+        lengths, and the result is sliced back to the true output length.
+        The padding slightly changes edge behaviour (the tail sees silence
+        instead of wrapping around to the start), which is harmless for speech.
+
         Args:
             audio: Input audio array
             original_rate: Original sample rate
@@ -353,8 +425,26 @@ class AudioProcessor:
             return audio
 
         try:
-            num_samples = int(len(audio) * target_rate / original_rate)
-            resampled = signal.resample(audio, num_samples)
+            n = len(audio)
+            num_samples = int(n * target_rate / original_rate)
+
+            # Pad to a multiple of the reduced rate ratio so the padded output
+            # length is an exact integer and both FFT sizes stay fast.
+            g = math.gcd(original_rate, target_rate)
+            up, down = target_rate // g, original_rate // g
+            blocks = next_fast_len(-(-n // down))
+            n_pad = blocks * down
+            if n_pad > n:
+                pad_width = [(0, n_pad - n)] + [(0, 0)] * (audio.ndim - 1)
+                audio = np.pad(audio, pad_width)
+
+            backend = _pyfftw_backend()
+            if backend is None:
+                resampled = signal.resample(audio, blocks * up)
+            else:
+                with scipy.fft.set_backend(backend):
+                    resampled = signal.resample(audio, blocks * up)
+            resampled = resampled[:num_samples]
             logger.debug(f"Resampled {original_rate}Hz -> {target_rate}Hz")
             return resampled.astype(np.float32)
         except Exception as e:
@@ -381,20 +471,32 @@ class AudioProcessor:
         if audio.size == 0:
             return np.array([], dtype=bool)
 
+        # No window's RMS can exceed the peak: skip the scan for silent input
+        if _peak_abs(audio) <= threshold:
+            return np.zeros(len(audio), dtype=bool)
+
         # Window/hop sizes derived from sample_rate (previously hardcoded for 16kHz)
         window_size = max(1, int(sample_rate * 0.025))  # 25ms
         hop_size = max(1, int(sample_rate * 0.010))     # 10ms
 
-        activity = np.zeros(len(audio), dtype=bool)
-
-        for i in range(0, len(audio) - window_size, hop_size):
-            window = audio[i:i + window_size]
-            rms = np.sqrt(np.mean(np.square(window)))
-
-            if rms > threshold:
-                activity[i:i + window_size] = True
-
-        return activity
+        n = len(audio)
+        starts = np.arange(0, n - window_size, hop_size)
+
+        # Energy of every window from one cumulative sum (float64, so the
+        # differences stay exact on long recordings)
+        csum = np.empty(n + 1, dtype=np.float64)
+        csum[0] = 0.0
+        np.square(audio, out=csum[1:])
+        np.cumsum(csum[1:], out=csum[1:])
+        window_rms = np.sqrt((csum[starts + window_size] - csum[starts]) / window_size)
+        voiced = starts[window_rms > threshold]
+
+        # Windows overlap (25ms window, 10ms hop), so mark each voiced window's
+        # full span: +1 where it starts, -1 where it ends, then a running count.
+        edges = np.zeros(n + 1, dtype=np.int32)
+        edges[voiced] += 1
+        edges[voiced + window_size] -= 1
+        return np.cumsum(edges[:n]) > 0
 
     @staticmethod
     def trim_silence(
@@ -418,19 +520,20 @@ class AudioProcessor:
         if audio.size == 0:
             return audio, 0, 0
 
-        # Detect voice activity (pass sample_rate so windows scale correctly)
+        # Detect voice activity (pass sample_rate so windows scale correctly).
+        # Quiet input is caught by its peak check and comes back all-False,
+        # taking the no-voice branch below.
         activity = AudioProcessor.detect_voice_activity(audio, threshold, sample_rate)
 
-        # Find first and last voice activity
-        voice_indices = np.where(activity)[0]
-
-        if len(voice_indices) == 0:
+        # Find first and last voice activity (argmax stops at the first True,
+        # so no index array of every voiced sample is built)
+        if not activity.any():
             # No voice detected, return empty or original
             logger.warning("No voice activity detected in audio")
             return audio, 0, len(audio)
 
-        start_idx = voice_indices[0]
-        end_idx = voice_indices[-1]
+        start_idx = int(activity.argmax())
+        end_idx = len(activity) - 1 - int(activity[::-1].argmax())
 
         # Add small padding
         padding_samples = int(0.1 * sample_rate)  # 100ms padding
@@ -470,21 +573,27 @@ class AudioProcessor:
             logger.warning("Empty audio provided to processor")
             return audio
 
+        # Whether ``audio`` is a fresh buffer we may modify in place (as opposed
+        # to the caller's array, or a view of it returned by trim_silence)
+        owned = False
+
         # Convert to mono if stereo
         if audio.ndim > 1:
             audio = AudioProcessor.stereo_to_mono(audio)
+            owned = True
 
         # Resample if needed
         if sample_rate != target_rate:
             audio = AudioProcessor.resample(audio, sample_rate, target_rate)
+            owned = True
 
-        # Trim silence
+        # Trim silence (returns a view, so ownership carries over)
         if trim_silence_enabled:
             audio, _, _ = AudioProcessor.trim_silence(audio, target_rate, vad_threshold)
 
-        # Normalize
+        # Normalize; scale our own buffer in place to skip another full-size copy
         if normalize and audio.size > 0:
-            audio = AudioProcessor.normalize(audio)
+            audio = AudioProcessor.normalize(audio, in_place=owned)
 
         logger.info(f"Processed audio: {len(audio) / target_rate:.2f}s duration")
         return audio
@@ -2,8 +2,9 @@
 
 import logging
 import threading
+import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import sounddevice as sd
 
@@ -13,10 +14,14 @@ logger = logging.getLogger(__name__)
 
 _sd_lock = threading.RLock()
 
+# Seconds an enumeration result stays valid. Devices rarely change between the
+# back-to-back lookups done while starting a recording.
+_DEVICE_CACHE_TTL = 5.0
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AudioDevice:
-    """Represents an audio input device."""
+    """Represents an audio input device (immutable, hashable)."""
     id: int
     name: str
     channels: int
@@ -28,11 +33,24 @@ class AudioDevice:
 class DeviceManager:
     """Manages audio device enumeration and selection."""
 
+    # (monotonic timestamp, devices) of the last successful enumeration
+    _device_cache: Optional[Tuple[float, Tuple[AudioDevice, ...]]] = None
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop the cached device list so the next lookup queries PortAudio."""
+        with _sd_lock:
+            cls._device_cache = None
+
     @staticmethod
     def list_input_devices() -> List[AudioDevice]:
         """
         List all available audio input devices.
 
+        Results are cached for a few seconds, since every query walks all
+        PortAudio devices and host APIs. Call ``invalidate_cache()`` to force
+        a fresh enumeration (e.g. after a device was plugged in).
+
         Returns:
             List of AudioDevice objects for input-capable devices
 
@@ -40,6 +58,10 @@ class DeviceManager:
             AudioDeviceError: If device enumeration fails
         """
         with _sd_lock:
+            cached = DeviceManager._device_cache
+            if cached is not None and time.monotonic() - cached[0] < _DEVICE_CACHE_TTL:
+                return list(cached[1])
+
             try:
                 devices = sd.query_devices()
                 input_devices = []
@@ -65,9 +87,11 @@ class DeviceManager:
                     )
 
                 logger.info(f"Found {len(input_devices)} input device(s)")
-                return input_devices
+                DeviceManager._device_cache = (time.monotonic(), tuple(input_devices))
+                return list(input_devices)
 
             except sd.PortAudioError as e:
+                DeviceManager.invalidate_cache()
                 raise AudioDeviceError(f"Failed to enumerate audio devices: {e}") from e
             except Exception as e:
                 raise AudioDeviceError(f"Unexpected error listing devices: {e}") from e
@@ -158,6 +182,8 @@ class DeviceManager:
                 test_stream.close()
                 logger.info(f"Device '{device.name}' validated for {sample_rate}Hz, {channels}ch")
             except sd.PortAudioError as e:
+                # The device may have disappeared; don't keep serving it
+                DeviceManager.invalidate_cache()
                 raise AudioDeviceError(
                     f"Device '{device.name}' doesn't support {sample_rate}Hz/{channels}ch: {e}"
                 ) from e
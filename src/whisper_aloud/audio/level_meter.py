@@ -1,6 +1,7 @@
 """Real-time audio level metering."""
 
 import logging
+import math
 from dataclasses import dataclass
 from typing import Optional
 
@@ -59,11 +60,14 @@ class LevelMeter:
         if audio_chunk.size == 0:
             return AudioLevel(rms=0.0, peak=0.0, db=-100.0)
 
-        # Calculate RMS (root mean square)
-        rms = float(np.sqrt(np.mean(np.square(audio_chunk))))
+        # Calculate RMS (root mean square). The dot product reduces in one BLAS
+        # call without materialising the squared chunk; the single sqrt is done
+        # on the Python scalar.
+        samples = audio_chunk.reshape(-1)
+        rms = math.sqrt(float(np.dot(samples, samples)) / samples.size)
 
-        # Calculate peak
-        peak = float(np.max(np.abs(audio_chunk)))
+        # Calculate peak (allocation-free: two reductions, no |x| buffer)
+        peak = max(float(samples.max()), -float(samples.min()))
 
         # Apply ballistic smoothing: attack when rising, release when falling
         if self._last_rms is not None:
@@ -77,12 +81,12 @@ class LevelMeter:
         self._last_peak = peak
 
         # Calculate decibels (avoid log(0))
-        db = 20 * np.log10(max(rms, 1e-10))
+        db = 20.0 * math.log10(max(rms, 1e-10))
 
         return AudioLevel(
             rms=min(1.0, rms),
             peak=min(1.0, peak),
-            db=float(db),
+            db=db,
         )
 
     def reset(self) -> None:
@@ -1,10 +1,11 @@
 """Audio recording with state management."""
 
+import collections
 import logging
 import threading
 import time
 from enum import Enum
-from typing import Callable, List, Optional
+from typing import Callable, Deque, Optional
 
 import numpy as np
 import sounddevice as sd
@@ -17,6 +18,9 @@ from .level_meter import AudioLevel, LevelMeter
 
 logger = logging.getLogger(__name__)
 
+# Blocks waiting to be metered; older ones are dropped if the meter falls behind
+_LEVEL_QUEUE_SIZE = 8
+
 
 class RecordingState(Enum):
     """Recording state machine."""
@@ -63,12 +67,22 @@ class AudioRecorder:
         self._state = RecordingState.IDLE
         self._state_lock = threading.Lock()
 
-        # Recording data
-        self._frames: List[np.ndarray] = []
+        # Recording data: one contiguous mono buffer sized for the maximum
+        # recording duration, filled at a moving write offset by the callback.
+        self._buffer: Optional[np.ndarray] = None
+        self._write_pos = 0
         self._stream: Optional[sd.InputStream] = None
         self._device: Optional[AudioDevice] = None
         self._start_time: Optional[float] = None
 
+        # Level metering runs on its own thread. The audio callback only queues
+        # a view of the block it just stored, so PortAudio's thread never runs
+        # the meter or the user callback.
+        self._level_queue: Deque[np.ndarray] = collections.deque(maxlen=_LEVEL_QUEUE_SIZE)
+        self._level_wakeup = threading.Event()
+        self._level_thread: Optional[threading.Thread] = None
+        self._level_running = False
+
         # Components
         self._level_meter = LevelMeter(attack_ms=10.0, release_ms=300.0, sample_rate=config.sample_rate)
         self._processor = AudioProcessor()  # Keep for format conversion utilities
@@ -100,6 +114,19 @@ class AudioRecorder:
             logger.debug(f"State: {self._state.value} -> {new_state.value}")
             self._state = new_state
 
+    def _reset_buffer(self) -> None:
+        """Allocate an empty recording buffer for a new session.
+
+        Sized for ``max_recording_duration`` plus one block of slack, because
+        the duration check runs after the block that crosses the limit has
+        been stored. ``np.empty`` only reserves address space, so pages are
+        committed as the recording actually grows.
+        """
+        blocksize = int(self.config.chunk_duration * self.config.sample_rate)
+        max_samples = int(self.config.max_recording_duration * self.config.sample_rate)
+        self._buffer = np.empty(max_samples + blocksize, dtype=np.float32)
+        self._write_pos = 0
+
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         """
         Callback for audio stream (runs in audio thread).
@@ -116,26 +143,67 @@ class AudioRecorder:
         if self.state != RecordingState.RECORDING:
             return
 
-        # Copy audio data (indata is read-only)
-        audio_chunk = indata[:, 0].copy() if indata.ndim > 1 else indata.copy()
+        # Copy straight into the recording buffer (indata is reused by PortAudio
+        # after the callback returns). The stream is mono, so this is one memcpy.
+        samples = indata[:, 0] if indata.ndim > 1 else indata
+        start = self._write_pos
+        end = min(start + samples.shape[0], self._buffer.shape[0])
+        self._buffer[start:end] = samples[:end - start]
+        self._write_pos = end
 
-        # Store frame
-        self._frames.append(audio_chunk)
-
-        # Calculate and report level
-        if self.level_callback:
-            try:
-                level = self._level_meter.calculate_level(audio_chunk)
-                self.level_callback(level)
-            except Exception as e:
-                logger.error(f"Level callback error: {e}")
+        # Hand the block to the level thread (O(1), never blocks)
+        if self._level_thread is not None:
+            self._level_queue.append(self._buffer[start:end])
+            self._level_wakeup.set()
 
         # Check max duration — audio callbacks must not block, so delegate to a thread
-        if self.recording_duration >= self.config.max_recording_duration:
+        if (self.recording_duration >= self.config.max_recording_duration
+                or end == self._buffer.shape[0]):
             logger.warning(f"Max recording duration reached: {self.config.max_recording_duration}s")
             self._set_state(RecordingState.STOPPING)
             threading.Thread(target=self._auto_stop, daemon=True).start()
 
+    def _level_loop(self) -> None:
+        """Meter queued blocks and report levels (runs on the level thread)."""
+        while True:
+            self._level_wakeup.wait()
+            self._level_wakeup.clear()
+            if not self._level_running:
+                return
+            while self._level_queue:
+                audio_chunk = self._level_queue.popleft()
+                # level_callback is public and may be set or cleared at any time
+                callback = self.level_callback
+                if callback is None:
+                    continue
+                try:
+                    level = self._level_meter.calculate_level(audio_chunk)
+                    callback(level)
+                except Exception as e:
+                    logger.error(f"Level callback error: {e}")
+
+    def _start_level_thread(self) -> None:
+        """Start the level metering thread (runs even without a callback, so one set later still fires)."""
+        self._level_queue.clear()
+        self._level_wakeup.clear()
+        self._level_running = True
+        self._level_thread = threading.Thread(
+            target=self._level_loop, name="audio-level", daemon=True
+        )
+        self._level_thread.start()
+
+    def _stop_level_thread(self) -> None:
+        """Stop the level metering thread and drop any blocks still queued."""
+        thread = self._level_thread
+        if thread is None:
+            return
+        self._level_thread = None
+        self._level_running = False
+        self._level_wakeup.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._level_queue.clear()
+
     def _auto_stop(self) -> None:
         """Stop recording when max duration is reached (called from a thread, not the callback)."""
         try:
@@ -165,26 +233,29 @@ class AudioRecorder:
             return
 
         try:
-            # Validate device
+            # Validate device. Capture is always mono: only the first channel was
+            # ever kept, so asking PortAudio for one channel avoids moving (and
+            # discarding) the others through every callback.
             device_id = device_id or self.config.device_id
             self._device = DeviceManager.validate_device(
                 device_id,
                 self.config.sample_rate,
-                self.config.channels
+                1
             )
 
             logger.info(f"Starting recording on device: {self._device.name}")
 
             # Reset state
-            self._frames = []
+            self._reset_buffer()
             self._level_meter.reset()
             self._start_time = time.time()
+            self._start_level_thread()
 
             # Open stream
             self._stream = sd.InputStream(
                 device=self._device.id,
                 samplerate=self.config.sample_rate,
-                channels=self.config.channels,
+                channels=1,
                 dtype='float32',
                 callback=self._audio_callback,
                 blocksize=int(self.config.chunk_duration * self.config.sample_rate),
@@ -198,6 +269,7 @@ class AudioRecorder:
             self._set_state(RecordingState.ERROR)
             raise
         except Exception as e:
+            self._stop_level_thread()
             self._set_state(RecordingState.ERROR)
             raise AudioRecordingError(f"Failed to start recording: {e}") from e
 
@@ -218,29 +290,30 @@ class AudioRecorder:
             logger.info("Stopping recording...")
             self._set_state(RecordingState.STOPPING)
 
-            # Close stream FIRST so the callback stops appending frames
+            # Close stream FIRST so the callback stops writing to the buffer
             if self._stream:
                 self._stream.stop()
                 self._stream.close()
                 self._stream = None
+            self._stop_level_thread()
 
-            # Now safe to read _frames — callback cannot append after stream is closed
+            # Now safe to read the buffer — callback cannot write after stream is closed
             with self._state_lock:
-                frames_snapshot = list(self._frames)
+                buffer, recorded = self._buffer, self._write_pos
+                self._buffer = None
+                self._write_pos = 0
 
-            # Concatenate frames
-            if not frames_snapshot:
+            if buffer is None or recorded == 0:
                 logger.warning("No audio frames recorded")
                 self._set_state(RecordingState.IDLE)
                 return np.array([], dtype=np.float32)
 
-            raw_audio = np.concatenate(frames_snapshot)
+            # Zero-copy view of the recorded part of the buffer
+            raw_audio = buffer[:recorded]
             logger.info(f"Recorded {len(raw_audio) / self.config.sample_rate:.2f}s of audio")
 
-            # Format conversion (mono, resample)
+            # Format conversion (resample; the buffer is already mono)
             audio = raw_audio
-            if audio.ndim > 1:
-                audio = AudioProcessor.stereo_to_mono(audio)
             if self.config.sample_rate != 16000:
                 audio = AudioProcessor.resample(audio, self.config.sample_rate, 16000)
 
@@ -267,8 +340,10 @@ class AudioRecorder:
             self._stream.stop()
             self._stream.close()
             self._stream = None
+        self._stop_level_thread()
 
-        self._frames = []
+        self._buffer = None
+        self._write_pos = 0
         self._set_state(RecordingState.IDLE)
         logger.info("Recording cancelled")
 
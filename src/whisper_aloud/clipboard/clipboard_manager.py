@@ -2,15 +2,32 @@
 
 import logging
 import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ..config import ClipboardConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a raw fd (no text-IO layer).
+
+    New files are created 0600: the fallback holds clipboard contents and
+    usually lives in /tmp.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class ClipboardManager:
     """Cross-platform clipboard operations with automatic fallback."""
 
@@ -23,6 +40,18 @@ class ClipboardManager:
         """
         self.config = config
         self._session_type = self.detect_session_type()
+        # Resolve the clipboard tools on PATH once, so each copy execs an
+        # absolute path instead of searching PATH again. A missing tool keeps
+        # its bare name and still fails with FileNotFoundError at copy time.
+        self._wl_copy_argv = (shutil.which('wl-copy') or 'wl-copy', '--paste-once')
+        self._xclip_argv = (shutil.which('xclip') or 'xclip', '-selection', 'clipboard')
+        # Last wl-copy spawned; it outlives copy() to serve the selection
+        self._wl_copy: Optional[subprocess.Popen] = None
+        # Redundant fallback writes after a successful copy run here, off the
+        # caller's thread, so they overlap with the paste that follows
+        self._fallback_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="clipboard-fallback"
+        )
         logger.info(f"Clipboard manager initialized for {self._session_type} session")
 
     @staticmethod
@@ -72,36 +101,45 @@ class ClipboardManager:
         Returns:
             True if successful (clipboard or fallback)
         """
+        # Encoded once; the fallback file reuses the same bytes
+        data = text.encode('utf-8')
+
+        # Reap the previous wl-copy if it has exited (after its paste, or on
+        # losing the selection) so finished copies don't linger as zombies
+        if self._wl_copy is not None and self._wl_copy.poll() is not None:
+            self._wl_copy = None
+
         try:
             # Run wl-copy as a background process (it needs to stay running to serve clipboard)
-            # Use --paste-once so it exits after the first paste operation
+            # Use --paste-once so it exits after the first paste operation.
+            # Its output is never read, so don't hold pipes open for it.
             process = subprocess.Popen(
-                ['wl-copy', '--paste-once'],
+                self._wl_copy_argv,
                 stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
+            self._wl_copy = process
             # Write the text and close stdin (non-blocking)
             try:
-                process.stdin.write(text.encode('utf-8'))
+                process.stdin.write(data)
                 process.stdin.close()
             except (OSError, IOError) as e:
                 logger.error(f"Failed to write to wl-copy stdin: {e}")
                 logger.info("Using fallback file instead")
-                return self._copy_fallback(text)
+                return self._copy_fallback(text, data)
             # Don't wait for process to finish - it needs to stay running
             logger.info("✓ Copied to clipboard via wl-copy (background process)")
-            # Still write fallback for redundancy
-            self._copy_fallback(text)
+            self._save_redundant_copy(text, data)
             return True
         except FileNotFoundError:
             logger.warning("wl-copy not found. Install: sudo apt install wl-clipboard")
             logger.info("Using fallback file instead")
-            return self._copy_fallback(text)
+            return self._copy_fallback(text, data)
         except Exception as e:
             logger.error(f"wl-copy failed: {e}")
             logger.info("Using fallback file instead")
-            return self._copy_fallback(text)
+            return self._copy_fallback(text, data)
 
     def _copy_x11(self, text: str) -> bool:
         """
@@ -113,48 +151,60 @@ class ClipboardManager:
         Returns:
             True if successful (clipboard or fallback)
         """
+        data = text.encode('utf-8')
         try:
+            # xclip forks a child that stays alive to serve the selection. That
+            # child inherits stdout/stderr, so capturing them would make run()
+            # wait on the pipes until the selection is replaced; discard them.
             subprocess.run(
-                ['xclip', '-selection', 'clipboard'],
-                input=text.encode('utf-8'),
+                self._xclip_argv,
+                input=data,
                 timeout=self.config.timeout_seconds,
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             logger.info("✓ Copied to clipboard via xclip")
-            # Write fallback for redundancy
-            self._copy_fallback(text)
+            self._save_redundant_copy(text, data)
             return True
         except FileNotFoundError:
             logger.warning("xclip not found. Install: sudo apt install xclip")
             logger.info("Using fallback file instead")
-            return self._copy_fallback(text)
+            return self._copy_fallback(text, data)
         except subprocess.TimeoutExpired:
             logger.error(f"xclip timeout after {self.config.timeout_seconds}s")
             logger.info("Using fallback file instead")
-            return self._copy_fallback(text)
+            return self._copy_fallback(text, data)
         except subprocess.CalledProcessError as e:
             logger.error(f"xclip failed with exit code {e.returncode}")
             logger.info("Using fallback file instead")
-            return self._copy_fallback(text)
+            return self._copy_fallback(text, data)
         except Exception as e:
             logger.error(f"xclip failed: {e}")
             logger.info("Using fallback file instead")
-            return self._copy_fallback(text)
+            return self._copy_fallback(text, data)
+
+    def _save_redundant_copy(self, text: str, data: bytes) -> None:
+        """Write the fallback file after a successful copy, if configured (in background)."""
+        if self.config.fallback_on_success:
+            self._fallback_executor.submit(self._copy_fallback, text, data)
 
-    def _copy_fallback(self, text: str) -> bool:
+    def _copy_fallback(self, text: str, data: Optional[bytes] = None) -> bool:
         """
         Fallback: write to temp file (ALWAYS succeeds).
 
         Args:
             text: Text to write
+            data: ``text`` already encoded as UTF-8, if the caller has it
 
         Returns:
             True if successful, False only in catastrophic failure
         """
+        if data is None:
+            data = text.encode('utf-8')
         try:
             fallback_path = Path(self.config.fallback_path)
-            fallback_path.write_text(text, encoding='utf-8')
+            _write_bytes(str(fallback_path), data)
             logger.info(f"💾 Text saved to {fallback_path}")
             return True
         except Exception as e:
@@ -162,7 +212,7 @@ class ClipboardManager:
             # Last resort: try /tmp with generic name
             try:
                 emergency_path = Path("/tmp/whisper_clipboard.txt")
-                emergency_path.write_text(text, encoding='utf-8')
+                _write_bytes(str(emergency_path), data)
                 logger.warning(f"Emergency backup to {emergency_path}")
                 return True
             except Exception as e2:
@@ -181,4 +231,5 @@ class ClipboardManager:
         """
         from .paste_simulator import PasteSimulator
         simulator = PasteSimulator(self._session_type, self.config)
-        return simulator.check_availability()
+        # User-facing diagnostic: report the current state, not a cached one
+        return simulator.check_availability(refresh=True)
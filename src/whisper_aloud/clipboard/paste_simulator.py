@@ -1,16 +1,149 @@
 """Keyboard paste simulation for WhisperAloud."""
 
+import functools
 import grp
 import logging
 import os
+import shutil
+import socket
+import struct
 import subprocess
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ..config import ClipboardConfig
 
 logger = logging.getLogger(__name__)
 
+# ydotoold (ydotool >= 1.0) reads raw ``struct input_event`` datagrams from its
+# socket and forwards them to uinput: (tv_sec, tv_usec, type, code, value).
+_INPUT_EVENT = struct.Struct('llHHi')
+_EV_SYN = 0
+_EV_KEY = 1
+_YDOTOOL_KEY_DELAY = 0.012  # ydotool key's default --key-delay (12ms)
+
+
+def _ydotool_socket_path() -> str:
+    """Return the ydotoold socket path, resolved the way the ydotool client does."""
+    path = os.environ.get('YDOTOOL_SOCKET')
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        runtime_path = os.path.join(runtime_dir, '.ydotool_socket')
+        if os.path.exists(runtime_path):
+            return runtime_path
+    return '/tmp/.ydotool_socket'
+
+
+# Environment probes. Group membership cannot change without a new login, so
+# it is probed once. A tool can be installed, or ydotoold started, while we
+# run, so those probes only remember positive answers: a missing tool or an
+# inactive/unknown service is probed again next time.
+# check_availability(refresh=True) re-probes everything.
+
+def _cache_positive(func):
+    """Memoize ``func`` per argument, but only results that are True."""
+    found = set()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        if args in found:
+            return True
+        result = func(*args)
+        if result is True:
+            found.add(args)
+        return result
+
+    wrapper.cache_clear = found.clear
+    return wrapper
+
+
+@_cache_positive
+def _which(tool: str) -> bool:
+    """Return whether ``tool`` is on PATH (resolved in-process, no ``which`` fork)."""
+    return shutil.which(tool) is not None
+
+
+_YDOTOOL_UNIT = 'ydotool.service'
+
+
+def _systemd_unit_active(bus, unit: str) -> bool:
+    """Return whether ``unit`` is active on the systemd instance behind ``bus``."""
+    systemd = bus.get('org.freedesktop.systemd1')
+    try:
+        path = systemd.GetUnit(unit)
+    except Exception as e:
+        if 'NoSuchUnit' in str(e):  # not loaded on this bus: not active
+            return False
+        raise
+    state = bus.get('org.freedesktop.systemd1', path).ActiveState
+    return state in ('active', 'reloading')
+
+
+def _systemctl_unit_active(unit: str) -> Optional[bool]:
+    """Fallback for _ydotool_service_active() that runs ``systemctl is-active``."""
+    # The user and system unit queries are independent: run them concurrently
+    # and wait on a shared deadline instead of paying for them back to back.
+    procs = []
+    try:
+        for scope in (['--user'], []):
+            procs.append(subprocess.Popen(
+                ['systemctl', *scope, 'is-active', unit],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            ))
+        deadline = time.monotonic() + 2
+        codes = [p.wait(timeout=max(0.0, deadline - time.monotonic())) for p in procs]
+        return any(code == 0 for code in codes)
+    except subprocess.TimeoutExpired:
+        logger.warning("Timeout checking ydotool service status")
+    except FileNotFoundError:
+        logger.warning("systemctl not found, cannot check ydotool service")
+    except Exception as e:
+        logger.warning(f"Error checking ydotool service: {e}")
+    for p in procs:
+        if p.poll() is None:
+            p.kill()
+            p.wait()
+    return None
+
+
+@_cache_positive
+def _ydotool_service_active() -> Optional[bool]:
+    """
+    Return whether ydotool.service is active as a user or system unit.
+
+    Reads the unit's ActiveState from systemd over D-Bus (a socket round-trip
+    per bus); falls back to forking ``systemctl`` if pydbus is unavailable or
+    the query fails.
+
+    Returns:
+        True/False, or None if the state could not be determined
+    """
+    try:
+        from pydbus import SessionBus, SystemBus
+    except ImportError:
+        return _systemctl_unit_active(_YDOTOOL_UNIT)
+    try:
+        return (_systemd_unit_active(SessionBus(), _YDOTOOL_UNIT)
+                or _systemd_unit_active(SystemBus(), _YDOTOOL_UNIT))
+    except Exception as e:
+        logger.debug(f"systemd D-Bus query failed ({e}), falling back to systemctl")
+        return _systemctl_unit_active(_YDOTOOL_UNIT)
+
+
+@functools.lru_cache(maxsize=None)
+def _user_in_input_group() -> bool:
+    """Return whether this process has the ``input`` group (needed for ydotool)."""
+    # One lookup of the group by name, rather than resolving every gid we have
+    # (each a group-database query, possibly over LDAP/NIS)
+    try:
+        input_gid = grp.getgrnam('input').gr_gid
+    except KeyError:
+        return False  # no such group on this system
+    return input_gid in os.getgroups() or input_gid == os.getegid()
+
 
 class PasteSimulator:
     """Keyboard input simulation for paste operations."""
@@ -25,11 +158,18 @@ class PasteSimulator:
         """
         self.session_type = session_type
         self.config = config
+        # The shortcut is fixed for this simulator: resolve commands once
+        ydotool_keys = self._ydotool_keys()
+        self._ydotool_argv = ['ydotool', 'key'] + ydotool_keys
+        self._ydotool_events = [
+            tuple(int(part) for part in key.split(':')) for key in ydotool_keys
+        ]
+        self._xdotool_argv = ['xdotool', 'key', self._xdotool_shortcut()]
         logger.debug(f"PasteSimulator initialized for {session_type}")
 
     def _ydotool_keys(self) -> list:
         """Return ydotool key sequence for the configured paste shortcut."""
-        if getattr(self.config, 'paste_shortcut', 'ctrl+v') == 'ctrl+shift+v':
+        if self.config.paste_shortcut == 'ctrl+shift+v':
             # Ctrl=29, Shift=42, V=47
             return ['29:1', '42:1', '47:1', '47:0', '42:0', '29:0']
         # Default: Ctrl+V
@@ -37,8 +177,7 @@ class PasteSimulator:
 
     def _xdotool_shortcut(self) -> str:
         """Return xdotool shortcut string for the configured paste shortcut."""
-        shortcut = getattr(self.config, 'paste_shortcut', 'ctrl+v')
-        if shortcut == 'ctrl+shift+v':
+        if self.config.paste_shortcut == 'ctrl+shift+v':
             return 'ctrl+shift+v'
         return 'ctrl+v'
 
@@ -49,11 +188,7 @@ class PasteSimulator:
         Returns:
             True if successful, False otherwise
         """
-        # Add delay before paste if configured
-        if self.config.paste_delay_ms > 0:
-            delay_sec = self.config.paste_delay_ms / 1000.0
-            logger.debug(f"Waiting {delay_sec}s before paste")
-            time.sleep(delay_sec)
+        self._wait_paste_delay()
 
         if self.session_type == 'wayland':
             return self._paste_wayland()
@@ -63,43 +198,122 @@ class PasteSimulator:
             logger.error("Cannot simulate paste: unknown session type")
             return False
 
-    def _paste_wayland(self) -> bool:
+    def type_text(self, text: str) -> bool:
         """
-        Simulate paste using ydotool.
+        Type ``text`` into the focused window instead of pasting it.
+
+        One ydotool/xdotool invocation replaces the clipboard copy plus the
+        paste keystroke (two fork+execs and the clipboard round-trip). The
+        tools map characters through a US keyboard layout, so this is meant
+        for plain dictation; the clipboard path remains the default.
+
+        Args:
+            text: Text to type
 
         Returns:
             True if successful, False otherwise
         """
+        self._wait_paste_delay()
+
+        if self.session_type == 'wayland':
+            argv = ['ydotool', 'type', '--key-delay', '0', '--', text]
+        elif self.session_type == 'x11':
+            argv = ['xdotool', 'type', '--delay', '0', '--', text]
+        else:
+            logger.error("Cannot type text: unknown session type")
+            return False
+
+        if self._run_tool(argv):
+            logger.info(f"✓ Text typed via {argv[0]}")
+            return True
+        return False
+
+    def _wait_paste_delay(self) -> None:
+        """Sleep for the configured paste delay, if any."""
+        if self.config.paste_delay_ms > 0:
+            delay_sec = self.config.paste_delay_ms / 1000.0
+            logger.debug(f"Waiting {delay_sec}s before paste")
+            time.sleep(delay_sec)
+
+    def _run_tool(self, argv: list) -> bool:
+        """
+        Run an input simulation command (ydotool or xdotool).
+
+        Returns:
+            True if it exited successfully, False otherwise (errors are logged)
+        """
+        tool = argv[0]
         try:
-            # ydotool keycodes: 29=Ctrl, 47=V
-            # Format: keycode:1 (press), keycode:0 (release)
             subprocess.run(
-                ['ydotool', 'key'] + self._ydotool_keys(),
+                argv,
                 timeout=self.config.timeout_seconds,
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE  # logged on failure
             )
-            logger.info("✓ Paste simulated via ydotool")
             return True
         except FileNotFoundError:
-            logger.warning("ydotool not found. Install: sudo apt install ydotool")
+            logger.warning(f"{tool} not found. Install: sudo apt install {tool}")
             return False
         except PermissionError as e:
-            logger.error(f"ydotool permission denied: {e}")
-            logger.error("See setup instructions for ydotool permissions")
+            logger.error(f"{tool} permission denied: {e}")
+            logger.error(f"See setup instructions for {tool} permissions")
             return False
         except subprocess.TimeoutExpired:
-            logger.error(f"ydotool timeout after {self.config.timeout_seconds}s")
+            logger.error(f"{tool} timeout after {self.config.timeout_seconds}s")
             return False
         except subprocess.CalledProcessError as e:
-            logger.error(f"ydotool failed with exit code {e.returncode}")
+            logger.error(f"{tool} failed with exit code {e.returncode}")
             if e.stderr:
-                logger.error(f"ydotool stderr: {e.stderr.decode('utf-8', errors='ignore')}")
+                logger.error(f"{tool} stderr: {e.stderr.decode('utf-8', errors='ignore')}")
             return False
         except Exception as e:
-            logger.error(f"ydotool failed: {e}")
+            logger.error(f"{tool} failed: {e}")
             return False
 
+    def _send_ydotool_events(self) -> bool:
+        """
+        Send the paste key events straight to ydotoold's socket.
+
+        This is what the ydotool client does (each key event followed by a
+        SYN_REPORT, paced by the default key delay), minus the fork+exec.
+
+        Returns:
+            True if sent, False if the socket is unavailable (caller falls
+            back to running ydotool)
+        """
+        path = _ydotool_socket_path()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+                sock.connect(path)
+                for i, (code, value) in enumerate(self._ydotool_events):
+                    if i:
+                        time.sleep(_YDOTOOL_KEY_DELAY)
+                    sock.send(_INPUT_EVENT.pack(0, 0, _EV_KEY, code, value))
+                    sock.send(_INPUT_EVENT.pack(0, 0, _EV_SYN, 0, 0))
+            return True
+        except OSError as e:
+            logger.debug(f"ydotoold socket {path} unavailable: {e}")
+            return False
+
+    def _paste_wayland(self) -> bool:
+        """
+        Simulate paste via the ydotoold socket, falling back to the ydotool command.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._send_ydotool_events():
+            logger.info("✓ Paste simulated via ydotoold socket")
+            return True
+
+        # ydotool keycodes: 29=Ctrl, 47=V
+        # Format: keycode:1 (press), keycode:0 (release)
+        if self._run_tool(self._ydotool_argv):
+            logger.info("✓ Paste simulated via ydotool")
+            return True
+        return False
+
     def _paste_x11(self) -> bool:
         """
         Simulate paste using xdotool.
@@ -107,66 +321,37 @@ class PasteSimulator:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            subprocess.run(
-                ['xdotool', 'key', self._xdotool_shortcut()],
-                timeout=self.config.timeout_seconds,
-                check=True,
-                capture_output=True
-            )
+        if self._run_tool(self._xdotool_argv):
             logger.info("✓ Paste simulated via xdotool")
             return True
-        except FileNotFoundError:
-            logger.warning("xdotool not found. Install: sudo apt install xdotool")
-            return False
-        except subprocess.TimeoutExpired:
-            logger.error(f"xdotool timeout after {self.config.timeout_seconds}s")
-            return False
-        except subprocess.CalledProcessError as e:
-            logger.error(f"xdotool failed with exit code {e.returncode}")
-            if e.stderr:
-                logger.error(f"xdotool stderr: {e.stderr.decode('utf-8', errors='ignore')}")
-            return False
-        except Exception as e:
-            logger.error(f"xdotool failed: {e}")
-            return False
+        return False
 
-    def check_availability(self) -> Dict[str, Any]:
+    def check_availability(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Check if paste simulation is available.
 
+        Args:
+            refresh: Re-probe the tool and ydotool service instead of reusing
+                the results of an earlier check (e.g. after the user fixed them)
+
         Returns:
             Dictionary with keys:
             - available (bool): Whether paste is available
             - reason (str): Reason if not available (empty if available)
             - fix (str): Instructions to fix (empty if available)
         """
+        if refresh:
+            _which.cache_clear()
+            _ydotool_service_active.cache_clear()
+
         tool = 'ydotool' if self.session_type == 'wayland' else 'xdotool'
 
         # Check if tool exists
-        try:
-            result = subprocess.run(
-                ['which', tool],
-                capture_output=True,
-                timeout=2
-            )
-            if result.returncode != 0:
-                return {
-                    'available': False,
-                    'reason': f'{tool} not installed',
-                    'fix': f'Install with: sudo apt install {tool}'
-                }
-        except subprocess.TimeoutExpired:
+        if not _which(tool):
             return {
                 'available': False,
-                'reason': f'Timeout checking for {tool}',
-                'fix': 'Check system configuration'
-            }
-        except Exception as e:
-            return {
-                'available': False,
-                'reason': f'Error checking {tool}: {e}',
-                'fix': 'Check system configuration'
+                'reason': f'{tool} not installed',
+                'fix': f'Install with: sudo apt install {tool}'
             }
 
         # For Wayland, check additional permissions
@@ -182,37 +367,18 @@ class PasteSimulator:
         Returns:
             Dictionary with availability status
         """
-        # Check if ydotool service is running
-        try:
-            result = subprocess.run(
-                ['systemctl', '--user', 'is-active', 'ydotool.service'],
-                capture_output=True,
-                timeout=2
-            )
-            if result.returncode != 0:
-                # Try system service
-                result = subprocess.run(
-                    ['systemctl', 'is-active', 'ydotool.service'],
-                    capture_output=True,
-                    timeout=2
-                )
-                if result.returncode != 0:
-                    return {
-                        'available': False,
-                        'reason': 'ydotool service not running',
-                        'fix': 'Run: sudo systemctl enable --now ydotool.service'
-                    }
-        except subprocess.TimeoutExpired:
-            logger.warning("Timeout checking ydotool service status")
-        except FileNotFoundError:
-            logger.warning("systemctl not found, cannot check ydotool service")
-        except Exception as e:
-            logger.warning(f"Error checking ydotool service: {e}")
+        # Check if ydotool service is running (user or system unit); an
+        # undeterminable state is not treated as a failure
+        if _ydotool_service_active() is False:
+            return {
+                'available': False,
+                'reason': 'ydotool service not running',
+                'fix': 'Run: sudo systemctl enable --now ydotool.service'
+            }
 
         # Check input group membership
         try:
-            user_groups = [grp.getgrgid(g).gr_name for g in os.getgroups()]
-            if 'input' not in user_groups:
+            if not _user_in_input_group():
                 return {
                     'available': False,
                     'reason': 'User not in input group',
@@ -1,11 +1,12 @@
 """Configuration management for WhisperAloud."""
 
-import json
+import functools
 import logging
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Set, Tuple
 
 from .exceptions import ConfigurationError
 from .utils.validation_helpers import sanitize_language_code
@@ -16,40 +17,58 @@ logger = logging.getLogger(__name__)
 # Configuration Path Constants
 # =============================================================================
 
-CONFIG_DIR = Path.home() / ".config" / "whisper_aloud"
+_HOME = Path.home()  # resolved once at import (expanduser may hit the passwd db)
+CONFIG_DIR = _HOME / ".config" / "whisper_aloud"
 CONFIG_FILE = CONFIG_DIR / "config.json"
-DATA_DIR = Path.home() / ".local" / "share" / "whisper_aloud"
+DATA_DIR = _HOME / ".local" / "share" / "whisper_aloud"
+
+
+@functools.lru_cache(maxsize=8)
+def _config_file_for_home(home: Optional[str]) -> Path:
+    """Return the config file path for a given $HOME (memoized)."""
+    base = Path(home) if home else Path.home()  # unset/empty: passwd entry
+    return base / ".config" / "whisper_aloud" / "config.json"
+
+
+def _user_config_file() -> Path:
+    """Return the current user's config file path.
+
+    Resolved per call rather than taken from CONFIG_FILE so that HOME changes
+    (tests, sudo -E) are honoured, but memoized on $HOME so the
+    expanduser/pwd lookup behind Path.home() runs once per home directory.
+    """
+    return _config_file_for_home(os.environ.get("HOME"))
+
+
+# Prefix shared by every environment override read in load()
+ENV_PREFIX = "WHISPER_ALOUD_"
 
 
 # =============================================================================
 # Environment Variable Parsing Helpers
 # =============================================================================
 
-def parse_bool_env(env_var: str, default: bool) -> bool:
-    """Parse boolean environment variable with validation."""
-    value = os.getenv(env_var)
-    if value is None:
-        return default
+# Accepted boolean spellings (lowercased, stripped) and what they mean
+_BOOL_TABLE = {
+    'true': True, '1': True, 'yes': True, 'on': True,
+    'false': False, '0': False, 'no': False, 'off': False, '': False,
+}
 
-    value_lower = value.lower().strip()
-    if value_lower in ('true', '1', 'yes', 'on'):
-        return True
-    elif value_lower in ('false', '0', 'no', 'off', ''):
-        return False
-    else:
+
+def _parse_bool(env_var: str, value: str, default: bool) -> bool:
+    """Parse the boolean value ``value`` of ``env_var`` (``default`` if invalid)."""
+    parsed = _BOOL_TABLE.get(value.lower().strip())
+    if parsed is None:
         logger.warning(
             f"Invalid boolean value '{value}' for {env_var}. "
             f"Valid: true/false, 1/0, yes/no, on/off. Using default: {default}"
         )
         return default
+    return parsed
 
 
-def parse_int_env(env_var: str, default: int) -> int:
-    """Parse integer environment variable with validation."""
-    value = os.getenv(env_var)
-    if value is None:
-        return default
-
+def _parse_int(env_var: str, value: str, default: int) -> int:
+    """Parse the integer value ``value`` of ``env_var`` (``default`` if invalid)."""
     try:
         return int(value)
     except ValueError:
@@ -57,24 +76,83 @@ def parse_int_env(env_var: str, default: int) -> int:
         return default
 
 
+def _parse_float(env_var: str, value: str, default: float) -> float:
+    """Parse the float value ``value`` of ``env_var`` (``default`` if invalid)."""
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Invalid float value '{value}' for {env_var}. Using default: {default}")
+        return default
+
+
+def _parse_str(env_var: str, value: str, default: str) -> str:
+    """Take the value of ``env_var`` as is."""
+    return value
+
+
+def _parse_optional_int(env_var: str, value: str, default: Optional[int]) -> Optional[int]:
+    """Parse an integer, treating an empty value as unset."""
+    return _parse_int(env_var, value, default) if value else default
+
+
+def _parse_path(env_var: str, value: str, default: Optional[Path]) -> Optional[Path]:
+    """Parse a path, treating an empty value as unset."""
+    return Path(value) if value else default
+
+
+def parse_bool_env(env_var: str, default: bool) -> bool:
+    """Parse boolean environment variable with validation."""
+    value = os.getenv(env_var)
+    if value is None:
+        return default
+    return _parse_bool(env_var, value, default)
+
+
+def parse_int_env(env_var: str, default: int) -> int:
+    """Parse integer environment variable with validation."""
+    value = os.getenv(env_var)
+    if value is None:
+        return default
+    return _parse_int(env_var, value, default)
+
+
 def parse_float_env(env_var: str, default: float) -> float:
     """Parse float environment variable with validation."""
     value = os.getenv(env_var)
     if value is None:
         return default
+    return _parse_float(env_var, value, default)
+
 
+def _parse_json(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson if available, else the stdlib json module.
+
+    Imported here rather than at module level: json is only needed when there
+    is a config file to parse (not on a fresh install).
+    """
     try:
-        return float(value)
-    except ValueError:
-        logger.warning(f"Invalid float value '{value}' for {env_var}. Using default: {default}")
-        return default
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize ``data`` as 2-space indented JSON bytes, with orjson if available."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
 
 # =============================================================================
 # Configuration Dataclasses - SINGLE SOURCE OF TRUTH FOR DEFAULTS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for the Whisper model."""
     name: str = "base"
@@ -84,10 +162,10 @@ class ModelConfig:
 
 
 # Fields that trigger model reload when changed (class-level constant)
-MODEL_RELOAD_FIELDS: Set[str] = {"name", "device", "compute_type"}
+MODEL_RELOAD_FIELDS: FrozenSet[str] = frozenset({"name", "device", "compute_type"})
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionConfig:
     """Configuration for transcription settings."""
     language: str = "es"
@@ -97,10 +175,10 @@ class TranscriptionConfig:
 
 
 # Language change may trigger model reload (for optimization)
-TRANSCRIPTION_RELOAD_FIELDS: Set[str] = {"language"}
+TRANSCRIPTION_RELOAD_FIELDS: FrozenSet[str] = frozenset({"language"})
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfig:
     """Configuration for audio recording."""
     sample_rate: int = 16000
@@ -115,10 +193,10 @@ class AudioConfig:
 
 
 # Fields that require recorder re-initialization
-AUDIO_REINIT_FIELDS: Set[str] = {"device_id", "sample_rate", "channels"}
+AUDIO_REINIT_FIELDS: FrozenSet[str] = frozenset({"device_id", "sample_rate", "channels"})
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipboardConfig:
     """Configuration for clipboard integration."""
     auto_copy: bool = True
@@ -128,9 +206,11 @@ class ClipboardConfig:
     timeout_seconds: float = 5.0
     fallback_to_file: bool = True
     fallback_path: str = "/tmp/whisper_aloud_clipboard.txt"
+    fallback_on_success: bool = False      # also save fallback_path after a successful copy
+    prefer_type_over_paste: bool = False   # auto-paste by typing the text instead of copy + paste
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationConfig:
     """Configuration for desktop OSD notifications."""
     enabled: bool = True
@@ -140,7 +220,7 @@ class NotificationConfig:
     error: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistenceConfig:
     """Configuration for persistence/history."""
     db_path: Optional[Path] = None
@@ -161,14 +241,14 @@ class PersistenceConfig:
             self.audio_archive_path = DATA_DIR / "audio"
 
 
-@dataclass
+@dataclass(slots=True)
 class HotkeyConfig:
     """Configuration for global hotkey."""
     toggle_recording: str = "<Super><Alt>r"
     cancel_recording: str = "<Super><Alt>Escape"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioProcessingConfig:
     """Configuration for audio processing pipeline."""
     noise_gate_enabled: bool = True
@@ -182,7 +262,7 @@ class AudioProcessingConfig:
     limiter_ceiling_db: float = -1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordingFlowConfig:
     """Configuration for smart recording flow (MPRIS + hardware gain)."""
     pause_media: bool = True            # Pause active MPRIS players on record start
@@ -197,7 +277,149 @@ class RecordingFlowConfig:
 # Main Configuration Class
 # =============================================================================
 
-@dataclass
+# Top-level sections of WhisperAloudConfig and their field names, in
+# declaration order: the single source for to_dict()/from_dict()/copy()
+_SECTION_FIELD_NAMES: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (section, tuple(f.name for f in fields(section_cls)))
+    for section, section_cls in (
+        ("model", ModelConfig),
+        ("transcription", TranscriptionConfig),
+        ("audio", AudioConfig),
+        ("clipboard", ClipboardConfig),
+        ("notifications", NotificationConfig),
+        ("persistence", PersistenceConfig),
+        ("audio_processing", AudioProcessingConfig),
+        ("hotkey", HotkeyConfig),
+        ("recording_flow", RecordingFlowConfig),
+    )
+)
+
+# The same, as sets for from_dict()'s "is this a known field" checks
+_SECTION_FIELDS: Dict[str, frozenset] = {
+    section: frozenset(names) for section, names in _SECTION_FIELD_NAMES
+}
+
+# Fields stored as Path but serialized as str
+_PATH_FIELDS = frozenset({("persistence", "db_path"), ("persistence", "audio_archive_path")})
+
+# Accepted values checked by validate(). The tuples keep the order used in
+# error messages; the frozensets are what membership is tested against.
+_VALID_MODELS = (
+    "tiny", "base", "small", "medium",
+    "large-v1", "large-v2", "large-v3", "large",  # large is alias for large-v3
+    "large-v3-turbo", "turbo",  # turbo variants
+)
+_VALID_MODEL_SET = frozenset(_VALID_MODELS)
+_VALID_DEVICES = ("auto", "cpu", "cuda")
+_VALID_DEVICE_SET = frozenset(_VALID_DEVICES)
+_VALID_COMPUTE_TYPES = ("int8", "float16", "float32")
+_VALID_COMPUTE_TYPE_SET = frozenset(_VALID_COMPUTE_TYPES)
+_VALID_TASKS = ("transcribe", "translate")
+_VALID_TASK_SET = frozenset(_VALID_TASKS)
+_VALID_CHANNELS = frozenset({1, 2})
+
+
+def _is_one_of(value: Any, choices: frozenset) -> bool:
+    """Return whether ``value`` is in ``choices`` (False for unhashable values, e.g. a JSON list)."""
+    try:
+        return value in choices
+    except TypeError:
+        return False
+
+
+# Rules checked in order by validate(): (section, field, predicate, message).
+# The message is formatted with the offending value.
+_VALIDATION_RULES: Tuple[Tuple[str, str, Callable[[Any], bool], str], ...] = (
+    # Model (faster-whisper supported models)
+    ("model", "name", lambda v: _is_one_of(v, _VALID_MODEL_SET),
+     "Invalid model name '{value}'. Valid: " + ", ".join(_VALID_MODELS)),
+    ("model", "device", lambda v: _is_one_of(v, _VALID_DEVICE_SET),
+     "Invalid device '{value}'. Valid: " + ", ".join(_VALID_DEVICES)),
+    ("model", "compute_type", lambda v: _is_one_of(v, _VALID_COMPUTE_TYPE_SET),
+     "Invalid compute type '{value}'. Valid: " + ", ".join(_VALID_COMPUTE_TYPES)),
+    # Transcription ("auto" or 2-letter language code)
+    ("transcription", "language", lambda v: sanitize_language_code(v) is not None,
+     "Invalid language '{value}'. Valid: 'auto' or 2-letter ISO code (e.g., 'en', 'es')"),
+    ("transcription", "beam_size", lambda v: 1 <= v <= 10,
+     "Invalid beam size {value}. Must be 1-10"),
+    ("transcription", "task", lambda v: _is_one_of(v, _VALID_TASK_SET),
+     "Invalid task '{value}'. Valid: " + ", ".join(_VALID_TASKS)),
+    # Audio
+    ("audio", "sample_rate", lambda v: 8000 <= v <= 48000,
+     "Invalid sample rate {value}. Must be 8000-48000 Hz"),
+    ("audio", "channels", lambda v: _is_one_of(v, _VALID_CHANNELS),
+     "Invalid channels {value}. Must be 1 or 2"),
+    ("audio", "vad_threshold", lambda v: 0.0 < v < 1.0,
+     "Invalid VAD threshold {value}. Must be 0.0-1.0"),
+    ("audio", "chunk_duration", lambda v: 0.01 <= v <= 1.0,
+     "Invalid chunk duration {value}. Must be 0.01-1.0s"),
+    # Clipboard
+    ("clipboard", "timeout_seconds", lambda v: v > 0,
+     "Invalid clipboard timeout {value}. Must be > 0"),
+    ("clipboard", "paste_delay_ms", lambda v: v >= 0,
+     "Invalid paste delay {value}. Must be >= 0"),
+)
+
+# Environment overrides: (variable, section, field, parser). Parsers take
+# (variable, value, current) and return the value to set.
+_ENV_OVERRIDES: Tuple[Tuple[str, str, str, Callable[[str, str, Any], Any]], ...] = (
+    # Model
+    ('WHISPER_ALOUD_MODEL_NAME', 'model', 'name', _parse_str),
+    ('WHISPER_ALOUD_MODEL_DEVICE', 'model', 'device', _parse_str),
+    ('WHISPER_ALOUD_MODEL_COMPUTE_TYPE', 'model', 'compute_type', _parse_str),
+    ('WHISPER_ALOUD_MODEL_DOWNLOAD_ROOT', 'model', 'download_root', _parse_str),
+    # Transcription
+    ('WHISPER_ALOUD_LANGUAGE', 'transcription', 'language', _parse_str),
+    ('WHISPER_ALOUD_BEAM_SIZE', 'transcription', 'beam_size', _parse_int),
+    ('WHISPER_ALOUD_VAD_FILTER', 'transcription', 'vad_filter', _parse_bool),
+    ('WHISPER_ALOUD_TASK', 'transcription', 'task', _parse_str),
+    # Audio
+    ('WHISPER_ALOUD_SAMPLE_RATE', 'audio', 'sample_rate', _parse_int),
+    ('WHISPER_ALOUD_CHANNELS', 'audio', 'channels', _parse_int),
+    ('WHISPER_ALOUD_DEVICE_ID', 'audio', 'device_id', _parse_optional_int),
+    ('WHISPER_ALOUD_CHUNK_DURATION', 'audio', 'chunk_duration', _parse_float),
+    ('WHISPER_ALOUD_VAD_ENABLED', 'audio', 'vad_enabled', _parse_bool),
+    ('WHISPER_ALOUD_VAD_THRESHOLD', 'audio', 'vad_threshold', _parse_float),
+    ('WHISPER_ALOUD_SILENCE_DURATION', 'audio', 'silence_duration', _parse_float),
+    ('WHISPER_ALOUD_NORMALIZE_AUDIO', 'audio', 'normalize_audio', _parse_bool),
+    ('WHISPER_ALOUD_MAX_RECORDING_DURATION', 'audio', 'max_recording_duration', _parse_float),
+    # Clipboard
+    ('WHISPER_ALOUD_CLIPBOARD_AUTO_COPY', 'clipboard', 'auto_copy', _parse_bool),
+    ('WHISPER_ALOUD_CLIPBOARD_AUTO_PASTE', 'clipboard', 'auto_paste', _parse_bool),
+    ('WHISPER_ALOUD_CLIPBOARD_PASTE_DELAY_MS', 'clipboard', 'paste_delay_ms', _parse_int),
+    ('WHISPER_ALOUD_CLIPBOARD_PASTE_SHORTCUT', 'clipboard', 'paste_shortcut', _parse_str),
+    ('WHISPER_ALOUD_CLIPBOARD_TIMEOUT_SECONDS', 'clipboard', 'timeout_seconds', _parse_float),
+    ('WHISPER_ALOUD_CLIPBOARD_FALLBACK_TO_FILE', 'clipboard', 'fallback_to_file', _parse_bool),
+    ('WHISPER_ALOUD_CLIPBOARD_FALLBACK_PATH', 'clipboard', 'fallback_path', _parse_str),
+    ('WHISPER_ALOUD_CLIPBOARD_FALLBACK_ON_SUCCESS', 'clipboard', 'fallback_on_success', _parse_bool),
+    ('WHISPER_ALOUD_CLIPBOARD_PREFER_TYPE_OVER_PASTE', 'clipboard', 'prefer_type_over_paste', _parse_bool),
+    # Notifications
+    ('WHISPER_ALOUD_NOTIFICATIONS_ENABLED', 'notifications', 'enabled', _parse_bool),
+    ('WHISPER_ALOUD_NOTIFICATIONS_RECORDING_STARTED', 'notifications', 'recording_started', _parse_bool),
+    ('WHISPER_ALOUD_NOTIFICATIONS_RECORDING_STOPPED', 'notifications', 'recording_stopped', _parse_bool),
+    ('WHISPER_ALOUD_NOTIFICATIONS_TRANSCRIPTION_COMPLETED', 'notifications', 'transcription_completed', _parse_bool),
+    ('WHISPER_ALOUD_NOTIFICATIONS_ERROR', 'notifications', 'error', _parse_bool),
+    # Persistence
+    ('WHISPER_ALOUD_DB_PATH', 'persistence', 'db_path', _parse_path),
+    ('WHISPER_ALOUD_SAVE_AUDIO', 'persistence', 'save_audio', _parse_bool),
+    ('WHISPER_ALOUD_AUDIO_ARCHIVE', 'persistence', 'audio_archive_path', _parse_path),
+    ('WHISPER_ALOUD_AUDIO_FORMAT', 'persistence', 'audio_format', _parse_str),
+    ('WHISPER_ALOUD_DEDUPLICATE_AUDIO', 'persistence', 'deduplicate_audio', _parse_bool),
+    ('WHISPER_ALOUD_AUTO_CLEANUP', 'persistence', 'auto_cleanup_enabled', _parse_bool),
+    ('WHISPER_ALOUD_CLEANUP_DAYS', 'persistence', 'auto_cleanup_days', _parse_int),
+    ('WHISPER_ALOUD_MAX_ENTRIES', 'persistence', 'max_entries', _parse_int),
+    ('WHISPER_ALOUD_EDIT_HISTORY', 'persistence', 'edit_history_enabled', _parse_bool),
+    # Recording flow
+    ('WHISPER_ALOUD_PAUSE_MEDIA', 'recording_flow', 'pause_media', _parse_bool),
+    ('WHISPER_ALOUD_RAISE_MIC_GAIN', 'recording_flow', 'raise_mic_gain', _parse_bool),
+    ('WHISPER_ALOUD_TARGET_GAIN_LINEAR', 'recording_flow', 'target_gain_linear', _parse_float),
+    ('WHISPER_ALOUD_PRE_PAUSE_DELAY_MS', 'recording_flow', 'pre_pause_delay_ms', _parse_int),
+    ('WHISPER_ALOUD_POST_RESUME_DELAY_MS', 'recording_flow', 'post_resume_delay_ms', _parse_int),
+    ('WHISPER_ALOUD_GAIN_RESTORE_ON_CRASH', 'recording_flow', 'gain_restore_on_crash', _parse_bool),
+)
+
+
+@dataclass(slots=True)
 class WhisperAloudConfig:
     """Main configuration for WhisperAloud."""
     model: ModelConfig = field(default_factory=ModelConfig)
@@ -212,260 +434,120 @@ class WhisperAloudConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for serialization."""
-        return {
-            "model": {
-                "name": self.model.name,
-                "device": self.model.device,
-                "compute_type": self.model.compute_type,
-                "download_root": self.model.download_root,
-            },
-            "transcription": {
-                "language": self.transcription.language,
-                "beam_size": self.transcription.beam_size,
-                "vad_filter": self.transcription.vad_filter,
-                "task": self.transcription.task,
-            },
-            "audio": {
-                "sample_rate": self.audio.sample_rate,
-                "channels": self.audio.channels,
-                "device_id": self.audio.device_id,
-                "chunk_duration": self.audio.chunk_duration,
-                "vad_enabled": self.audio.vad_enabled,
-                "vad_threshold": self.audio.vad_threshold,
-                "silence_duration": self.audio.silence_duration,
-                "normalize_audio": self.audio.normalize_audio,
-                "max_recording_duration": self.audio.max_recording_duration,
-            },
-            "clipboard": {
-                "auto_copy": self.clipboard.auto_copy,
-                "auto_paste": self.clipboard.auto_paste,
-                "paste_delay_ms": self.clipboard.paste_delay_ms,
-                "paste_shortcut": self.clipboard.paste_shortcut,
-                "timeout_seconds": self.clipboard.timeout_seconds,
-                "fallback_to_file": self.clipboard.fallback_to_file,
-                "fallback_path": self.clipboard.fallback_path,
-            },
-            "notifications": {
-                "enabled": self.notifications.enabled,
-                "recording_started": self.notifications.recording_started,
-                "recording_stopped": self.notifications.recording_stopped,
-                "transcription_completed": self.notifications.transcription_completed,
-                "error": self.notifications.error,
-            },
-            "persistence": {
-                "db_path": str(self.persistence.db_path) if self.persistence.db_path else None,
-                "save_audio": self.persistence.save_audio,
-                "audio_archive_path": str(self.persistence.audio_archive_path) if self.persistence.audio_archive_path else None,
-                "audio_format": self.persistence.audio_format,
-                "deduplicate_audio": self.persistence.deduplicate_audio,
-                "auto_cleanup_enabled": self.persistence.auto_cleanup_enabled,
-                "auto_cleanup_days": self.persistence.auto_cleanup_days,
-                "max_entries": self.persistence.max_entries,
-                "edit_history_enabled": self.persistence.edit_history_enabled,
-            },
-            "audio_processing": {
-                "noise_gate_enabled": self.audio_processing.noise_gate_enabled,
-                "noise_gate_threshold_db": self.audio_processing.noise_gate_threshold_db,
-                "agc_enabled": self.audio_processing.agc_enabled,
-                "agc_target_db": self.audio_processing.agc_target_db,
-                "agc_max_gain_db": self.audio_processing.agc_max_gain_db,
-                "denoising_enabled": self.audio_processing.denoising_enabled,
-                "denoising_strength": self.audio_processing.denoising_strength,
-                "limiter_enabled": self.audio_processing.limiter_enabled,
-                "limiter_ceiling_db": self.audio_processing.limiter_ceiling_db,
-            },
-            "hotkey": {
-                "toggle_recording": self.hotkey.toggle_recording,
-                "cancel_recording": self.hotkey.cancel_recording,
-            },
-            "recording_flow": {
-                "pause_media": self.recording_flow.pause_media,
-                "raise_mic_gain": self.recording_flow.raise_mic_gain,
-                "target_gain_linear": self.recording_flow.target_gain_linear,
-                "pre_pause_delay_ms": self.recording_flow.pre_pause_delay_ms,
-                "post_resume_delay_ms": self.recording_flow.post_resume_delay_ms,
-                "gain_restore_on_crash": self.recording_flow.gain_restore_on_crash,
-            },
-        }
+        data = {}
+        for section, names in _SECTION_FIELD_NAMES:
+            values = getattr(self, section)
+            data[section] = {name: getattr(values, name) for name in names}
+        for section, name in _PATH_FIELDS:
+            value = data[section][name]
+            data[section][name] = str(value) if value else None
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WhisperAloudConfig':
         """Create config from dictionary."""
         config = cls()
 
-        if "model" in data:
-            for key, value in data["model"].items():
-                if hasattr(config.model, key):
-                    setattr(config.model, key, value)
-
-        if "transcription" in data:
-            for key, value in data["transcription"].items():
-                if hasattr(config.transcription, key):
-                    setattr(config.transcription, key, value)
-
-        if "audio" in data:
-            for key, value in data["audio"].items():
-                if hasattr(config.audio, key):
-                    setattr(config.audio, key, value)
-
-        if "clipboard" in data:
-            for key, value in data["clipboard"].items():
-                if hasattr(config.clipboard, key):
-                    setattr(config.clipboard, key, value)
-
-        if "notifications" in data:
-            for key, value in data["notifications"].items():
-                if hasattr(config.notifications, key):
-                    setattr(config.notifications, key, value)
-
-        if "persistence" in data:
-            for key, value in data["persistence"].items():
-                if hasattr(config.persistence, key):
-                    if key in ("db_path", "audio_archive_path") and value:
+        for section, names in _SECTION_FIELDS.items():
+            values = data.get(section)
+            if not values:
+                continue
+            target = getattr(config, section)
+            for key, value in values.items():
+                if key in names:
+                    if value and (section, key) in _PATH_FIELDS:
                         value = Path(value)
-                    setattr(config.persistence, key, value)
-
-        if "audio_processing" in data:
-            for key, value in data["audio_processing"].items():
-                if hasattr(config.audio_processing, key):
-                    setattr(config.audio_processing, key, value)
-
-        if "hotkey" in data:
-            for key, value in data["hotkey"].items():
-                if hasattr(config.hotkey, key):
-                    setattr(config.hotkey, key, value)
-
-        if "recording_flow" in data:
-            for key, value in data["recording_flow"].items():
-                if hasattr(config.recording_flow, key):
-                    setattr(config.recording_flow, key, value)
+                    setattr(target, key, value)
 
         return config
 
     def copy(self) -> 'WhisperAloudConfig':
         """Create a deep copy of the configuration."""
-        return WhisperAloudConfig.from_dict(self.to_dict())
+        # Section fields are all immutable values, so copying each section is
+        # a deep copy; no round-trip through to_dict()/from_dict() defaults.
+        return WhisperAloudConfig(**{
+            section: replace(getattr(self, section)) for section in _SECTION_FIELDS
+        })
 
     @classmethod
     def load(cls) -> 'WhisperAloudConfig':
         """
         Load configuration with priority: defaults < file < env vars.
 
+        The result is memoized: while the config file (path, mtime, size) and
+        the WHISPER_ALOUD_* environment are unchanged, later calls return a
+        copy of the cached config instead of re-reading and re-validating.
+
         Returns:
             WhisperAloudConfig instance
         """
-        # Compute path dynamically to support HOME changes in tests
-        config_file = Path.home() / ".config" / "whisper_aloud" / "config.json"
-
-        # Start with defaults from dataclass
-        config = cls()
-
-        # Load from config file if exists
-        if config_file.exists():
-            try:
-                with open(config_file, "r") as f:
-                    file_config = json.load(f)
-                logger.info(f"Loading configuration from {config_file}")
-                config = cls.from_dict(file_config)
-            except json.JSONDecodeError as e:
-                logger.error(f"Config file corrupted: {e}. Using defaults.")
-            except Exception as e:
-                logger.warning(f"Failed to load config from file: {e}")
-
-        # Apply environment variable overrides
-        config._apply_env_overrides()
+        global _load_cache
+
+        config_file = _user_config_file()
+
+        key = _load_cache_key(config_file)
+        cached = _load_cache
+        if cached is not None and cached[0] == key:
+            return cached[1].copy()
+
+        # Defaults are only built when the file doesn't provide a config:
+        # from_dict() already starts from them, so building them up front
+        # would construct every section twice.
+        config = None
+
+        # Load from config file if exists (open() tells us; no separate stat)
+        try:
+            with open(config_file, "rb") as f:
+                file_config = _parse_json(f.read())
+            logger.info(f"Loading configuration from {config_file}")
+            config = cls.from_dict(file_config)
+        except FileNotFoundError:
+            pass
+        except ValueError as e:  # JSONDecodeError (json and orjson) or bad UTF-8
+            logger.error(f"Config file corrupted: {e}. Using defaults.")
+        except Exception as e:
+            logger.warning(f"Failed to load config from file: {e}")
+
+        if config is None:
+            config = cls()
+
+        # Apply environment variable overrides. The cache key already lists
+        # the WHISPER_ALOUD_* variables; with none set (the usual case) the
+        # override table is skipped entirely.
+        env_overrides = key[-1]
+        if env_overrides:
+            config._apply_env_overrides(dict(env_overrides))
 
         # Sanitize and validate
         config._sanitize()
         config.validate()
 
+        # Callers own (and may mutate) what they get back: cache a copy
+        _load_cache = (key, config.copy())
         return config
 
-    def _apply_env_overrides(self) -> None:
-        """Apply environment variable overrides to config."""
-        # Model
-        self.model.name = os.getenv('WHISPER_ALOUD_MODEL_NAME', self.model.name)
-        self.model.device = os.getenv('WHISPER_ALOUD_MODEL_DEVICE', self.model.device)
-        self.model.compute_type = os.getenv('WHISPER_ALOUD_MODEL_COMPUTE_TYPE', self.model.compute_type)
-        self.model.download_root = os.getenv('WHISPER_ALOUD_MODEL_DOWNLOAD_ROOT', self.model.download_root)
-
-        # Transcription
-        self.transcription.language = os.getenv('WHISPER_ALOUD_LANGUAGE', self.transcription.language)
-        self.transcription.beam_size = parse_int_env('WHISPER_ALOUD_BEAM_SIZE', self.transcription.beam_size)
-        self.transcription.vad_filter = parse_bool_env('WHISPER_ALOUD_VAD_FILTER', self.transcription.vad_filter)
-        self.transcription.task = os.getenv('WHISPER_ALOUD_TASK', self.transcription.task)
-
-        # Audio
-        self.audio.sample_rate = parse_int_env('WHISPER_ALOUD_SAMPLE_RATE', self.audio.sample_rate)
-        self.audio.channels = parse_int_env('WHISPER_ALOUD_CHANNELS', self.audio.channels)
-        if os.getenv('WHISPER_ALOUD_DEVICE_ID'):
-            self.audio.device_id = parse_int_env('WHISPER_ALOUD_DEVICE_ID', self.audio.device_id)
-        self.audio.chunk_duration = parse_float_env('WHISPER_ALOUD_CHUNK_DURATION', self.audio.chunk_duration)
-        self.audio.vad_enabled = parse_bool_env('WHISPER_ALOUD_VAD_ENABLED', self.audio.vad_enabled)
-        self.audio.vad_threshold = parse_float_env('WHISPER_ALOUD_VAD_THRESHOLD', self.audio.vad_threshold)
-        self.audio.silence_duration = parse_float_env('WHISPER_ALOUD_SILENCE_DURATION', self.audio.silence_duration)
-        self.audio.normalize_audio = parse_bool_env('WHISPER_ALOUD_NORMALIZE_AUDIO', self.audio.normalize_audio)
-        self.audio.max_recording_duration = parse_float_env('WHISPER_ALOUD_MAX_RECORDING_DURATION', self.audio.max_recording_duration)
-
-        # Clipboard
-        self.clipboard.auto_copy = parse_bool_env('WHISPER_ALOUD_CLIPBOARD_AUTO_COPY', self.clipboard.auto_copy)
-        self.clipboard.auto_paste = parse_bool_env('WHISPER_ALOUD_CLIPBOARD_AUTO_PASTE', self.clipboard.auto_paste)
-        self.clipboard.paste_delay_ms = parse_int_env('WHISPER_ALOUD_CLIPBOARD_PASTE_DELAY_MS', self.clipboard.paste_delay_ms)
-        self.clipboard.paste_shortcut = os.getenv(
-            'WHISPER_ALOUD_CLIPBOARD_PASTE_SHORTCUT',
-            self.clipboard.paste_shortcut
-        )
-        self.clipboard.timeout_seconds = parse_float_env('WHISPER_ALOUD_CLIPBOARD_TIMEOUT_SECONDS', self.clipboard.timeout_seconds)
-        self.clipboard.fallback_to_file = parse_bool_env('WHISPER_ALOUD_CLIPBOARD_FALLBACK_TO_FILE', self.clipboard.fallback_to_file)
-        self.clipboard.fallback_path = os.getenv('WHISPER_ALOUD_CLIPBOARD_FALLBACK_PATH', self.clipboard.fallback_path)
-
-        # Notifications
-        self.notifications.enabled = parse_bool_env('WHISPER_ALOUD_NOTIFICATIONS_ENABLED', self.notifications.enabled)
-        self.notifications.recording_started = parse_bool_env(
-            'WHISPER_ALOUD_NOTIFICATIONS_RECORDING_STARTED', self.notifications.recording_started
-        )
-        self.notifications.recording_stopped = parse_bool_env(
-            'WHISPER_ALOUD_NOTIFICATIONS_RECORDING_STOPPED', self.notifications.recording_stopped
-        )
-        self.notifications.transcription_completed = parse_bool_env(
-            'WHISPER_ALOUD_NOTIFICATIONS_TRANSCRIPTION_COMPLETED', self.notifications.transcription_completed
-        )
-        self.notifications.error = parse_bool_env('WHISPER_ALOUD_NOTIFICATIONS_ERROR', self.notifications.error)
-
-        # Persistence
-        if os.getenv('WHISPER_ALOUD_DB_PATH'):
-            self.persistence.db_path = Path(os.getenv('WHISPER_ALOUD_DB_PATH'))
-        self.persistence.save_audio = parse_bool_env('WHISPER_ALOUD_SAVE_AUDIO', self.persistence.save_audio)
-        if os.getenv('WHISPER_ALOUD_AUDIO_ARCHIVE'):
-            self.persistence.audio_archive_path = Path(os.getenv('WHISPER_ALOUD_AUDIO_ARCHIVE'))
-        self.persistence.audio_format = os.getenv('WHISPER_ALOUD_AUDIO_FORMAT', self.persistence.audio_format)
-        self.persistence.deduplicate_audio = parse_bool_env('WHISPER_ALOUD_DEDUPLICATE_AUDIO', self.persistence.deduplicate_audio)
-        self.persistence.auto_cleanup_enabled = parse_bool_env('WHISPER_ALOUD_AUTO_CLEANUP', self.persistence.auto_cleanup_enabled)
-        self.persistence.auto_cleanup_days = parse_int_env('WHISPER_ALOUD_CLEANUP_DAYS', self.persistence.auto_cleanup_days)
-        self.persistence.max_entries = parse_int_env('WHISPER_ALOUD_MAX_ENTRIES', self.persistence.max_entries)
-        self.persistence.edit_history_enabled = parse_bool_env(
-            'WHISPER_ALOUD_EDIT_HISTORY', self.persistence.edit_history_enabled
-        )
+    @classmethod
+    def reload(cls) -> 'WhisperAloudConfig':
+        """Load configuration from file and environment, bypassing the load() cache."""
+        clear_load_cache()
+        return cls.load()
 
-        # Recording flow
-        self.recording_flow.pause_media = parse_bool_env(
-            'WHISPER_ALOUD_PAUSE_MEDIA', self.recording_flow.pause_media
-        )
-        self.recording_flow.raise_mic_gain = parse_bool_env(
-            'WHISPER_ALOUD_RAISE_MIC_GAIN', self.recording_flow.raise_mic_gain
-        )
-        self.recording_flow.target_gain_linear = parse_float_env(
-            'WHISPER_ALOUD_TARGET_GAIN_LINEAR', self.recording_flow.target_gain_linear
-        )
-        self.recording_flow.pre_pause_delay_ms = parse_int_env(
-            'WHISPER_ALOUD_PRE_PAUSE_DELAY_MS', self.recording_flow.pre_pause_delay_ms
-        )
-        self.recording_flow.post_resume_delay_ms = parse_int_env(
-            'WHISPER_ALOUD_POST_RESUME_DELAY_MS', self.recording_flow.post_resume_delay_ms
-        )
-        self.recording_flow.gain_restore_on_crash = parse_bool_env(
-            'WHISPER_ALOUD_GAIN_RESTORE_ON_CRASH', self.recording_flow.gain_restore_on_crash
-        )
+    def _apply_env_overrides(self, environ: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Apply environment variable overrides to config.
+
+        Args:
+            environ: Variables to read instead of os.environ. load() passes the
+                WHISPER_ALOUD_* snapshot it keyed its cache on, so the config
+                it caches matches that key even if the environment changes.
+        """
+        get_env = (os.environ if environ is None else environ).get  # bound once for the whole table
+        for env_var, section, name, parse in _ENV_OVERRIDES:
+            value = get_env(env_var)
+            if value is None:
+                continue
+            target = getattr(self, section)
+            setattr(target, name, parse(env_var, value, getattr(target, name)))
 
     def _sanitize(self) -> None:
         """Sanitize configuration values."""
@@ -483,75 +565,61 @@ class WhisperAloudConfig:
             self.transcription.language = sanitized
 
     def validate(self) -> None:
-        """Validate configuration values."""
-        # Validate model name (faster-whisper supported models)
-        valid_models = [
-            "tiny", "base", "small", "medium",
-            "large-v1", "large-v2", "large-v3", "large",  # large is alias for large-v3
-            "large-v3-turbo", "turbo",  # turbo variants
-        ]
-        if self.model.name not in valid_models:
-            raise ConfigurationError(f"Invalid model name '{self.model.name}'. Valid: {', '.join(valid_models)}")
-
-        # Validate device
-        valid_devices = ["auto", "cpu", "cuda"]
-        if self.model.device not in valid_devices:
-            raise ConfigurationError(f"Invalid device '{self.model.device}'. Valid: {', '.join(valid_devices)}")
-
-        # Validate compute type
-        valid_compute_types = ["int8", "float16", "float32"]
-        if self.model.compute_type not in valid_compute_types:
-            raise ConfigurationError(f"Invalid compute type '{self.model.compute_type}'. Valid: {', '.join(valid_compute_types)}")
-
-        # Validate language ("auto" or 2-letter code)
-        sanitized_language = sanitize_language_code(self.transcription.language)
-        if sanitized_language is None:
-            raise ConfigurationError(
-                f"Invalid language '{self.transcription.language}'. "
-                "Valid: 'auto' or 2-letter ISO code (e.g., 'en', 'es')"
-            )
-
-        # Validate beam size
-        if not (1 <= self.transcription.beam_size <= 10):
-            raise ConfigurationError(f"Invalid beam size {self.transcription.beam_size}. Must be 1-10")
-
-        # Validate task
-        valid_tasks = ["transcribe", "translate"]
-        if self.transcription.task not in valid_tasks:
-            raise ConfigurationError(f"Invalid task '{self.transcription.task}'. Valid: {', '.join(valid_tasks)}")
-
-        # Validate audio configuration
-        if not (8000 <= self.audio.sample_rate <= 48000):
-            raise ConfigurationError(f"Invalid sample rate {self.audio.sample_rate}. Must be 8000-48000 Hz")
-
-        if self.audio.channels not in (1, 2):
-            raise ConfigurationError(f"Invalid channels {self.audio.channels}. Must be 1 or 2")
-
-        if not (0.0 < self.audio.vad_threshold < 1.0):
-            raise ConfigurationError(f"Invalid VAD threshold {self.audio.vad_threshold}. Must be 0.0-1.0")
-
-        if not (0.01 <= self.audio.chunk_duration <= 1.0):
-            raise ConfigurationError(f"Invalid chunk duration {self.audio.chunk_duration}. Must be 0.01-1.0s")
-
-        # Validate clipboard configuration
-        if self.clipboard.timeout_seconds <= 0:
-            raise ConfigurationError(f"Invalid clipboard timeout {self.clipboard.timeout_seconds}. Must be > 0")
-
-        if self.clipboard.paste_delay_ms < 0:
-            raise ConfigurationError(f"Invalid paste delay {self.clipboard.paste_delay_ms}. Must be >= 0")
+        """
+        Validate configuration values.
+
+        Raises:
+            ConfigurationError: Listing every invalid value, not just the first
+        """
+        errors = []
+        for section, name, is_valid, message in _VALIDATION_RULES:
+            value = getattr(getattr(self, section), name)
+            if not is_valid(value):
+                errors.append(message.format(value=value))
+        if errors:
+            raise ConfigurationError("; ".join(errors))
 
     def save(self) -> Path:
         """Save configuration to file."""
-        # Compute path dynamically to support HOME changes in tests
-        config_dir = Path.home() / ".config" / "whisper_aloud"
-        config_file = config_dir / "config.json"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        with open(config_file, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        config_file = _user_config_file()
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        # Serialize up front and write the whole file in one call
+        payload = _dump_json(self.to_dict())
+        with open(config_file, "wb") as f:
+            f.write(payload)
+        clear_load_cache()
         logger.info(f"Configuration saved to {config_file}")
         return config_file
 
 
+# =============================================================================
+# Load Cache
+# =============================================================================
+
+# (key, config) from the last successful load(); see _load_cache_key()
+_load_cache: Optional[Tuple[Tuple, WhisperAloudConfig]] = None
+
+
+def _load_cache_key(config_file: Path) -> Tuple:
+    """Return what a load() result depends on: the config file and env overrides."""
+    try:
+        st = config_file.stat()
+        file_state = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        file_state = None
+    env = tuple(sorted(
+        (name, value) for name, value in os.environ.items()
+        if name.startswith(ENV_PREFIX)
+    ))
+    return (str(config_file), file_state, env)
+
+
+def clear_load_cache() -> None:
+    """Forget the memoized load() result (the next load() reads file and env again)."""
+    global _load_cache
+    _load_cache = None
+
+
 # =============================================================================
 # Change Detection
 # =============================================================================
@@ -579,6 +647,27 @@ class ConfigChanges:
         return "; ".join(parts) if parts else "no changes"
 
 
+# Fields compared by detect_config_changes(), per section, with the subsets
+# whose change requires a model reload or an audio reinit
+_NO_FIELDS: FrozenSet[str] = frozenset()
+_CHANGE_TRACKED_FIELDS = tuple(
+    # attrgetter(*names) snapshots the section in one call, so an unchanged
+    # section costs a single tuple comparison
+    (section, names, attrgetter(*names), reload_fields, reinit_fields)
+    for section, names, reload_fields, reinit_fields in (
+        ("model", ("name", "device", "compute_type"), MODEL_RELOAD_FIELDS, _NO_FIELDS),
+        # Language change triggers model reload for optimization
+        ("transcription", ("language", "beam_size", "task"), TRANSCRIPTION_RELOAD_FIELDS, _NO_FIELDS),
+        ("audio", ("device_id", "sample_rate", "channels", "vad_enabled", "vad_threshold",
+                   "normalize_audio"), _NO_FIELDS, AUDIO_REINIT_FIELDS),
+        ("clipboard", ("auto_copy", "auto_paste"), _NO_FIELDS, _NO_FIELDS),
+        ("notifications", ("enabled", "recording_started", "recording_stopped",
+                           "transcription_completed", "error"), _NO_FIELDS, _NO_FIELDS),
+        ("persistence", ("save_audio", "auto_cleanup_enabled"), _NO_FIELDS, _NO_FIELDS),
+    )
+)
+
+
 def detect_config_changes(old: WhisperAloudConfig, new: WhisperAloudConfig) -> ConfigChanges:
     """
     Detect changes between two configurations.
@@ -591,98 +680,24 @@ def detect_config_changes(old: WhisperAloudConfig, new: WhisperAloudConfig) -> C
         ConfigChanges describing what changed
     """
     changes = ConfigChanges()
-
-    # Check model changes
-    model_changes = set()
-    if old.model.name != new.model.name:
-        model_changes.add("name")
-    if old.model.device != new.model.device:
-        model_changes.add("device")
-    if old.model.compute_type != new.model.compute_type:
-        model_changes.add("compute_type")
-
-    if model_changes:
-        changes.changed_sections.add("model")
-        changes.changed_fields["model"] = model_changes
-        # Check if any reload-triggering fields changed
-        if model_changes & MODEL_RELOAD_FIELDS:
-            changes.requires_model_reload = True
-
-    # Check transcription changes
-    trans_changes = set()
-    if old.transcription.language != new.transcription.language:
-        trans_changes.add("language")
-    if old.transcription.beam_size != new.transcription.beam_size:
-        trans_changes.add("beam_size")
-    if old.transcription.task != new.transcription.task:
-        trans_changes.add("task")
-
-    if trans_changes:
-        changes.changed_sections.add("transcription")
-        changes.changed_fields["transcription"] = trans_changes
-        # Language change triggers model reload for optimization
-        if trans_changes & TRANSCRIPTION_RELOAD_FIELDS:
+    if old is new:
+        return changes
+
+    for section, names, snapshot, reload_fields, reinit_fields in _CHANGE_TRACKED_FIELDS:
+        old_values, new_values = getattr(old, section), getattr(new, section)
+        if snapshot(old_values) == snapshot(new_values):
+            continue
+        changed = {
+            name for name in names
+            if getattr(old_values, name) != getattr(new_values, name)
+        }
+        if not changed:
+            continue
+        changes.changed_sections.add(section)
+        changes.changed_fields[section] = changed
+        if changed & reload_fields:
             changes.requires_model_reload = True
-
-    # Check audio changes
-    audio_changes = set()
-    if old.audio.device_id != new.audio.device_id:
-        audio_changes.add("device_id")
-    if old.audio.sample_rate != new.audio.sample_rate:
-        audio_changes.add("sample_rate")
-    if old.audio.channels != new.audio.channels:
-        audio_changes.add("channels")
-    if old.audio.vad_enabled != new.audio.vad_enabled:
-        audio_changes.add("vad_enabled")
-    if old.audio.vad_threshold != new.audio.vad_threshold:
-        audio_changes.add("vad_threshold")
-    if old.audio.normalize_audio != new.audio.normalize_audio:
-        audio_changes.add("normalize_audio")
-
-    if audio_changes:
-        changes.changed_sections.add("audio")
-        changes.changed_fields["audio"] = audio_changes
-        # Check if audio reinit is needed
-        if audio_changes & AUDIO_REINIT_FIELDS:
+        if changed & reinit_fields:
             changes.requires_audio_reinit = True
 
-    # Check clipboard changes
-    clipboard_changes = set()
-    if old.clipboard.auto_copy != new.clipboard.auto_copy:
-        clipboard_changes.add("auto_copy")
-    if old.clipboard.auto_paste != new.clipboard.auto_paste:
-        clipboard_changes.add("auto_paste")
-
-    if clipboard_changes:
-        changes.changed_sections.add("clipboard")
-        changes.changed_fields["clipboard"] = clipboard_changes
-
-    # Check notification changes
-    notification_changes = set()
-    if old.notifications.enabled != new.notifications.enabled:
-        notification_changes.add("enabled")
-    if old.notifications.recording_started != new.notifications.recording_started:
-        notification_changes.add("recording_started")
-    if old.notifications.recording_stopped != new.notifications.recording_stopped:
-        notification_changes.add("recording_stopped")
-    if old.notifications.transcription_completed != new.notifications.transcription_completed:
-        notification_changes.add("transcription_completed")
-    if old.notifications.error != new.notifications.error:
-        notification_changes.add("error")
-
-    if notification_changes:
-        changes.changed_sections.add("notifications")
-        changes.changed_fields["notifications"] = notification_changes
-
-    # Check persistence changes
-    persistence_changes = set()
-    if old.persistence.save_audio != new.persistence.save_audio:
-        persistence_changes.add("save_audio")
-    if old.persistence.auto_cleanup_enabled != new.persistence.auto_cleanup_enabled:
-        persistence_changes.add("auto_cleanup_enabled")
-
-    if persistence_changes:
-        changes.changed_sections.add("persistence")
-        changes.changed_fields["persistence"] = persistence_changes
-
     return changes
@@ -27,3 +27,8 @@ def __getattr__(name):
         globals()[name] = value
         return value
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazy exports so dir() and tab completion list them before first use."""
+    return sorted(set(globals()) | set(__all__))
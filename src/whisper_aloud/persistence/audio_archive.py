@@ -1,13 +1,20 @@
 """Audio file archiving with FLAC compression and deduplication."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
-import soundfile as sf
 
 logger = logging.getLogger(__name__)
 
+# Threads deleting orphaned files; unlink is latency-bound, so a few in flight
+# overlap the per-file filesystem round trips
+_ORPHAN_DELETE_WORKERS = 8
+
 
 class AudioArchive:
     """
@@ -55,7 +62,6 @@ class AudioArchive:
             IOError: If file write fails
         """
         # Create date-based subdirectory (YYYY/MM/)
-        from datetime import datetime
         now = datetime.now()
         subdir = self.archive_path / f"{now.year:04d}" / f"{now.month:02d}"
         subdir.mkdir(parents=True, exist_ok=True)
@@ -70,17 +76,24 @@ class AudioArchive:
             logger.debug(f"Audio file already exists: {file_path}")
             return file_path
 
-        # Ensure audio is in correct format
-        if audio.dtype != np.float32:
+        # Ensure audio is in correct format (astype copies, so a converted
+        # array is ours to modify in place below)
+        converted = audio.dtype != np.float32
+        if converted:
             audio = audio.astype(np.float32)
 
-        # Ensure audio is normalized to [-1, 1]
-        max_val = np.abs(audio).max()
+        # Ensure audio is normalized to [-1, 1]. Peak from two reductions over
+        # the samples: np.abs(audio).max() would allocate a full-size temporary.
+        max_val = max(float(audio.max()), -float(audio.min()))
         if max_val > 1.0:
             logger.warning(f"Audio not normalized (max={max_val:.3f}), clipping to [-1, 1]")
-            audio = np.clip(audio, -1.0, 1.0)
+            audio = np.clip(audio, -1.0, 1.0, out=audio if converted else None)
+
+        # Write FLAC file. soundfile (and libsndfile behind it) is imported
+        # here so archives that are only listed, cleaned or deleted from never
+        # load it.
+        import soundfile as sf
 
-        # Write FLAC file
         # FLAC compression levels: 0 (fastest) to 8 (best compression)
         # Level 5 is good balance of speed and size
         try:
@@ -144,29 +157,50 @@ class AudioArchive:
         referenced_paths = db.get_all_audio_paths()
         logger.debug(f"Found {len(referenced_paths)} audio files referenced in database")
 
-        # Scan archive directory for all FLAC files
-        archive_files = set(self.archive_path.rglob("*.flac"))
+        # Scan archive directory for all FLAC files. Compared as plain strings:
+        # str hashing is much cheaper than Path hashing for large archives.
+        archive_files = {entry.path for entry in self._scan_flac_files()}
         logger.debug(f"Found {len(archive_files)} FLAC files in archive")
 
         # Find orphans (files in archive but not in database)
-        orphaned_files = archive_files - referenced_paths
+        orphaned_files = archive_files - {str(path) for path in referenced_paths}
 
         # Delete orphaned files
         deleted_count = 0
-        for file_path in orphaned_files:
-            try:
-                file_path.unlink()
-                deleted_count += 1
-                logger.debug(f"Deleted orphaned audio file: {file_path}")
-            except Exception as e:
-                logger.warning(f"Failed to delete orphaned file {file_path}: {e}")
-
-        # Clean up empty directories
-        self._cleanup_empty_dirs(self.archive_path)
+        if orphaned_files:
+            workers = min(_ORPHAN_DELETE_WORKERS, len(orphaned_files))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="audio-orphan-cleanup"
+            ) as pool:
+                deleted_count = sum(pool.map(self._delete_orphan, orphaned_files))
+
+        # Remove the YYYY/MM directories the deletions left empty. Each one is
+        # checked once, however many orphans it held.
+        for directory in {os.path.dirname(path) for path in orphaned_files}:
+            self._cleanup_empty_dirs(Path(directory))
 
         logger.info(f"Orphan cleanup complete: deleted {deleted_count} files")
         return deleted_count
 
+    @staticmethod
+    def _delete_orphan(file_path: str) -> bool:
+        """
+        Delete one orphaned file (runs on a cleanup worker thread).
+
+        Args:
+            file_path: Path of the orphaned FLAC file
+
+        Returns:
+            True if the file was deleted
+        """
+        try:
+            os.unlink(file_path)
+            logger.debug(f"Deleted orphaned audio file: {file_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to delete orphaned file {file_path}: {e}")
+            return False
+
     def get_size(self) -> int:
         """
         Get total size of audio archive in bytes.
@@ -175,11 +209,11 @@ class AudioArchive:
             Total size in bytes
         """
         total_size = 0
-        for file_path in self.archive_path.rglob("*.flac"):
+        for entry in self._scan_flac_files():
             try:
-                total_size += file_path.stat().st_size
+                total_size += entry.stat().st_size
             except Exception as e:
-                logger.warning(f"Failed to get size of {file_path}: {e}")
+                logger.warning(f"Failed to get size of {entry.path}: {e}")
 
         return total_size
 
@@ -190,7 +224,26 @@ class AudioArchive:
         Returns:
             Number of FLAC files
         """
-        return len(list(self.archive_path.rglob("*.flac")))
+        return sum(1 for _ in self._scan_flac_files())
+
+    def _scan_flac_files(self) -> Iterator[os.DirEntry]:
+        """
+        Yield a directory entry for every FLAC file under the archive root.
+
+        Uses os.scandir rather than Path.rglob: file/dir checks come from the
+        directory listing itself, and no Path object is built per file.
+        """
+        pending = [str(self.archive_path)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".flac") and entry.is_file():
+                            yield entry
+            except OSError as e:
+                logger.warning(f"Failed to scan archive directory: {e}")
 
     def _cleanup_empty_dirs(self, start_dir: Path) -> None:
         """
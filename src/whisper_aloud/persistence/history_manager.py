@@ -505,4 +505,6 @@ class HistoryManager:
         Returns:
             Hexadecimal hash string
         """
-        return hashlib.sha256(audio.tobytes()).hexdigest()
+        # hashlib reads the array's buffer directly; tobytes() would first copy
+        # the whole recording. Same bytes (C order), so hashes are unchanged.
+        return hashlib.sha256(np.ascontiguousarray(audio)).hexdigest()
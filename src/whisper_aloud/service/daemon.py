@@ -693,6 +693,44 @@ class WhisperAloudService:
         self._ensure_model_loaded()
         return self.transcriber.transcribe_numpy(audio_data)
 
+    def _deliver_text(self, text: str) -> None:
+        """Copy and/or auto-paste a transcription as configured (runs in thread)."""
+        clipboard = self.config.clipboard
+        if not (clipboard.auto_copy and self.clipboard_manager):
+            return
+        auto_paste = clipboard.auto_paste and bool(text)
+        # Typing the text directly replaces copy + paste keystroke; if it
+        # fails, fall back to copy + paste so the text is not lost
+        if auto_paste and clipboard.prefer_type_over_paste:
+            try:
+                from ..clipboard import PasteSimulator
+                simulator = PasteSimulator(
+                    self.clipboard_manager._session_type,
+                    clipboard,
+                )
+                logger.info("Auto-type triggered")
+                if simulator.type_text(text):
+                    return
+                logger.warning("Failed to type transcription, falling back to clipboard paste")
+            except Exception as e:
+                logger.warning(f"Failed to type transcription ({e}), falling back to clipboard paste")
+        try:
+            self.clipboard_manager.copy(text)
+            logger.info("Transcription copied to clipboard")
+        except Exception as e:
+            logger.warning(f"Failed to copy to clipboard: {e}")
+        if auto_paste:
+            try:
+                from ..clipboard import PasteSimulator
+                simulator = PasteSimulator(
+                    self.clipboard_manager._session_type,
+                    clipboard,
+                )
+                logger.info("Auto-paste triggered")
+                simulator.simulate_paste()
+            except Exception as e:
+                logger.warning(f"Failed to trigger auto-paste: {e}")
+
     def _transcribe_and_emit(self, audio_data) -> None:
         """Transcribe audio and emit completion signal (runs in thread).
 
@@ -729,36 +767,15 @@ class WhisperAloudService:
                     self.indicator.set_state("idle")
                     self.indicator.set_last_text(result.text)
                 self.TranscriptionReady(result.text, meta)
-                if self.config.clipboard.auto_copy and self.clipboard_manager:
-                    try:
-                        self.clipboard_manager.copy(result.text)
-                        logger.info("Transcription copied to clipboard")
-                    except Exception as e:
-                        logger.warning(f"Failed to copy to clipboard: {e}")
-                if (self.config.clipboard.auto_copy
-                        and self.config.clipboard.auto_paste
-                        and self.clipboard_manager
-                        and result.text):
-                    try:
-                        from ..clipboard import PasteSimulator
-                        import threading as _threading
-                        simulator = PasteSimulator(
-                            self.clipboard_manager._session_type,
-                            self.config.clipboard,
-                        )
-                        _threading.Thread(
-                            target=simulator.simulate_paste,
-                            daemon=True,
-                        ).start()
-                        logger.info("Auto-paste triggered")
-                    except Exception as e:
-                        logger.warning(f"Failed to trigger auto-paste: {e}")
                 if self.notifications:
                     self.notifications.show_transcription_completed(result.text)
                 logger.info("Transcription completed and signals emitted")
                 return False
 
             GLib.idle_add(_emit_success)
+            # Copy/paste fork and wait on helper tools: do it here, on the
+            # worker thread, while the main loop emits the signals
+            self._deliver_text(result.text)
 
         except Exception as e:
             error_message = str(e)
@@ -238,6 +238,8 @@ class SettingsDialog(Gtk.Window):
         device_label.set_hexpand(True)
 
         from ..audio import DeviceManager
+        # Re-enumerate so devices plugged in since the last lookup show up
+        DeviceManager.invalidate_cache()
         self._devices = DeviceManager.list_input_devices()
         device_names = [
             f"{d.name}" + (" ⭐" if d.is_default else "")
@@ -11,6 +11,12 @@ from whisper_aloud.persistence.database import TranscriptionDatabase
 from whisper_aloud.persistence.models import HistoryEntry
 
 
+@pytest.fixture(autouse=True)
+def _no_ydotool_socket(monkeypatch, tmp_path):
+    """Never let paste tests inject keys through a real ydotoold on the dev machine."""
+    monkeypatch.setenv("YDOTOOL_SOCKET", str(tmp_path / "no-ydotoold.sock"))
+
+
 @pytest.fixture
 def temp_db_path():
     """Temporary database path."""
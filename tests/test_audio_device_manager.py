@@ -202,3 +202,51 @@ def test_device_manager_concurrent_queries_safe():
         t.join()
 
     assert errors == [], f"Unexpected errors in concurrent queries: {errors}"
+
+
+# ── Device list cache ─────────────────────────────────────────────────────────
+
+def test_list_input_devices_cached():
+    """Repeated lookups within the TTL reuse one PortAudio enumeration."""
+    fake_sd = _build_fake_sounddevice()
+    fake_sd.query_devices.return_value = [
+        {"max_input_channels": 2, "name": "USB Mic", "default_samplerate": 48000.0, "hostapi": 0},
+    ]
+    module = _import_device_manager_with_fake_sounddevice(fake_sd)
+
+    first = module.DeviceManager.list_input_devices()
+    first.clear()  # callers get their own list
+    second = module.DeviceManager.list_input_devices()
+    assert [d.name for d in second] == ["USB Mic"]
+    assert fake_sd.query_devices.call_count == 1
+
+    module.DeviceManager.invalidate_cache()
+    module.DeviceManager.list_input_devices()
+    assert fake_sd.query_devices.call_count == 2
+
+
+def test_validate_device_stream_failure_invalidates_cache():
+    """A PortAudio failure while probing a device drops the cached device list."""
+    fake_sd = _build_fake_sounddevice()
+    fake_sd.query_devices.return_value = [
+        {"max_input_channels": 2, "name": "USB Mic", "default_samplerate": 48000.0, "hostapi": 0},
+    ]
+    fake_sd.InputStream.side_effect = fake_sd.PortAudioError("Stream error")
+    module = _import_device_manager_with_fake_sounddevice(fake_sd)
+
+    with pytest.raises(AudioDeviceError):
+        module.DeviceManager.validate_device(0, 16000, 1)
+    assert module.DeviceManager._device_cache is None
+
+
+def test_audio_device_is_frozen_and_hashable():
+    """AudioDevice instances are immutable value objects usable as set/dict keys."""
+    import dataclasses
+
+    from whisper_aloud.audio import AudioDevice
+
+    device = AudioDevice(1, "Mic 1", 1, 16000.0, True, "ALSA")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        device.name = "Other"
+    assert not hasattr(device, "__dict__")
+    assert {device, AudioDevice(1, "Mic 1", 1, 16000.0, True, "ALSA")} == {device}
@@ -1,3 +1,5 @@
+import time
+
 import numpy as np
 
 
@@ -66,6 +68,20 @@ class TestNoiseGate:
         diffs = np.abs(np.diff(result))
         assert np.max(diffs) < 0.15, f"Click detected: max diff {np.max(diffs)}"
 
+    def test_gate_float32_long_recording(self):
+        """Level detection stays accurate in float32 over a long loud-then-quiet take."""
+        from whisper_aloud.audio.audio_processor import NoiseGate
+
+        gate = NoiseGate(threshold_db=-40.0)
+        sr = 16000
+        rng = np.random.default_rng(0)
+        loud = (rng.standard_normal(sr * 120) * 0.3).astype(np.float32)
+        quiet = (rng.standard_normal(sr * 2) * 0.001).astype(np.float32)
+        result = gate.process(np.concatenate([loud, quiet]), sample_rate=sr)
+        assert result.dtype == np.float32
+        # Well past hold + release, the quiet tail must be gated
+        assert np.max(np.abs(result[-sr:])) < 1e-4
+
 
 class TestAGC:
     """Tests for automatic gain control."""
@@ -401,9 +417,10 @@ class TestRecorderPipelineIntegration:
         recorder._pipeline.process.return_value = np.zeros(1600, dtype=np.float32)
 
         # Put recorder into recording state and add frames
+        recorder._reset_buffer()
         recorder._set_state(RecordingState.RECORDING)
-        recorder._frames = [np.zeros(1600, dtype=np.float32)]
-        recorder._start_time = 0.0
+        recorder._start_time = time.time()
+        recorder._audio_callback(np.zeros((1600, 1), dtype=np.float32), 1600, None, None)
 
         recorder.stop()
         recorder._pipeline.process.assert_called_once()
@@ -427,11 +444,12 @@ class TestRecorderPipelineIntegration:
         recorder._pipeline = MagicMock()
         recorder._pipeline.process.side_effect = lambda audio, sample_rate: audio
 
-        # Put recorder into recording state with stereo frames
+        # Put recorder into recording state and feed a stereo block
+        recorder._reset_buffer()
         recorder._set_state(RecordingState.RECORDING)
+        recorder._start_time = time.time()
         stereo_frame = np.zeros((4800, 2), dtype=np.float32)
-        recorder._frames = [stereo_frame]
-        recorder._start_time = 0.0
+        recorder._audio_callback(stereo_frame, 4800, None, None)
 
         recorder.stop()
 
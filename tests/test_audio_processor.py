@@ -21,6 +21,24 @@ def test_normalize_empty():
     assert len(normalized) == 0
 
 
+def test_normalize_in_place():
+    """In-place normalization scales the given buffer and returns it."""
+    audio = np.array([0.5, -0.25], dtype=np.float32)
+    result = AudioProcessor.normalize(audio, target_level=1.0, in_place=True)
+
+    assert result is audio
+    np.testing.assert_allclose(audio, [1.0, -0.5])
+
+
+def test_normalize_negative_peak():
+    """A negative-going peak sets the scale and the dtype stays float32."""
+    audio = np.array([0.2, -0.8, 0.4], dtype=np.float32)
+    normalized = AudioProcessor.normalize(audio, target_level=0.4)
+
+    assert normalized.dtype == np.float32
+    np.testing.assert_allclose(normalized, [0.1, -0.4, 0.2], rtol=1e-6)
+
+
 def test_stereo_to_mono():
     """Test stereo to mono conversion."""
     stereo = np.array([[0.5, 0.3], [0.2, 0.4]], dtype=np.float32)
@@ -48,6 +66,60 @@ def test_resample():
     assert len(resampled) == expected_length
 
 
+def test_resample_prime_length():
+    """Prime-length input is padded internally but keeps the exact output length."""
+    n = 44101  # prime: would force a slow, non-composite FFT without padding
+    audio = np.sin(2 * np.pi * 440 * np.arange(n) / 44100).astype(np.float32)
+    resampled = AudioProcessor.resample(audio, 44100, 16000)
+
+    assert len(resampled) == int(n * 16000 / 44100)
+    assert resampled.dtype == np.float32
+    expected = np.sin(2 * np.pi * 440 * np.arange(len(resampled)) / 16000)
+    assert np.abs(resampled[500:-500] - expected[500:-500]).max() < 1e-3
+
+
+def test_resample_uses_pyfftw_backend_when_installed():
+    """If pyFFTW is importable, resampling FFTs are dispatched to its scipy.fft backend."""
+    import sys
+    from types import ModuleType, SimpleNamespace
+    from unittest.mock import Mock, patch
+
+    from whisper_aloud.audio import audio_processor
+
+    calls = []
+    backend = ModuleType("pyfftw.interfaces.scipy_fft")
+    backend.__ua_domain__ = "numpy.scipy.fft"
+
+    def ua_function(method, args, kwargs):
+        calls.append(method.__name__)
+        return NotImplemented  # fall through to scipy's own implementation
+
+    backend.__ua_function__ = ua_function
+    interfaces = ModuleType("pyfftw.interfaces")
+    interfaces.scipy_fft = backend
+    interfaces.cache = SimpleNamespace(enable=Mock())
+    pyfftw = ModuleType("pyfftw")
+    pyfftw.interfaces = interfaces
+    pyfftw.config = SimpleNamespace(NUM_THREADS=1)
+
+    fake_modules = {
+        "pyfftw": pyfftw,
+        "pyfftw.interfaces": interfaces,
+        "pyfftw.interfaces.scipy_fft": backend,
+    }
+    audio_processor._pyfftw_backend.cache_clear()
+    try:
+        with patch.dict(sys.modules, fake_modules):
+            audio = np.zeros(4410, dtype=np.float32)
+            resampled = AudioProcessor.resample(audio, 44100, 16000)
+    finally:
+        audio_processor._pyfftw_backend.cache_clear()
+
+    assert len(resampled) == 1600
+    assert calls, "resample did not dispatch through the pyFFTW backend"
+    interfaces.cache.enable.assert_called_once()
+
+
 def test_resample_same_rate():
     """Test resampling with same input/output rate."""
     audio = np.array([0.1, 0.2, 0.3], dtype=np.float32)
@@ -76,6 +148,24 @@ def test_detect_voice_activity_empty():
     assert len(activity) == 0
 
 
+def test_detect_voice_activity_marks_full_window_spans():
+    """Each voiced 25ms window marks all its samples, matching a per-window scan."""
+    sr = 16000
+    window, hop = 400, 160
+    rng = np.random.default_rng(1)
+    audio = (rng.standard_normal(sr) * 0.001).astype(np.float32)
+    audio[3000:3100] = 0.5
+    audio[9000:12000] = 0.2
+
+    expected = np.zeros(len(audio), dtype=bool)
+    for i in range(0, len(audio) - window, hop):
+        if np.sqrt(np.mean(np.square(audio[i:i + window]))) > 0.02:
+            expected[i:i + window] = True
+
+    activity = AudioProcessor.detect_voice_activity(audio, threshold=0.02, sample_rate=sr)
+    np.testing.assert_array_equal(activity, expected)
+
+
 def test_trim_silence():
     """Test silence trimming."""
     # Create audio with silence at start and end
@@ -91,6 +181,22 @@ def test_trim_silence():
     assert end <= len(audio)
 
 
+def test_trim_silence_bounds_from_first_and_last_voiced_sample():
+    """Trim bounds are the first/last voiced samples widened by 100ms padding."""
+    sr = 16000
+    audio = np.zeros(3 * sr, dtype=np.float32)
+    audio[10000:12000] = 0.3
+    audio[30000:30500] = -0.3
+
+    activity = AudioProcessor.detect_voice_activity(audio, 0.02, sr)
+    voiced = np.flatnonzero(activity)
+    trimmed, start, end = AudioProcessor.trim_silence(audio, sr)
+
+    assert (start, end) == (voiced[0] - 1600, voiced[-1] + 1600)
+    assert isinstance(start, int) and isinstance(end, int)
+    assert len(trimmed) == end - start
+
+
 def test_trim_silence_no_voice():
     """Test trimming when no voice is detected."""
     silent = np.zeros(16000, dtype=np.float32)
@@ -102,6 +208,35 @@ def test_trim_silence_no_voice():
     assert end == len(silent)
 
 
+def test_vad_skips_window_scan_below_threshold():
+    """Audio whose peak is under the threshold is reported silent without scanning windows."""
+    from unittest.mock import patch
+
+    quiet = np.full(16000, 0.01, dtype=np.float32)
+    quiet[::2] = -0.015
+    with patch.object(np, "cumsum", side_effect=AssertionError("window scan ran")):
+        activity = AudioProcessor.detect_voice_activity(quiet, threshold=0.02)
+        trimmed, start, end = AudioProcessor.trim_silence(quiet, 16000, threshold=0.02)
+
+    assert activity.shape == quiet.shape and not activity.any()
+    assert trimmed is quiet and (start, end) == (0, len(quiet))
+
+
+def test_trim_silence_computes_peak_once():
+    """trim_silence leaves the quiet-input check to detect_voice_activity: one peak pass."""
+    from unittest.mock import patch
+
+    from whisper_aloud.audio import audio_processor
+
+    audio = np.zeros(16000, dtype=np.float32)
+    audio[4000:12000] = 0.5
+    with patch.object(audio_processor, "_peak_abs", wraps=audio_processor._peak_abs) as peak:
+        trimmed, start, end = AudioProcessor.trim_silence(audio, 16000)
+
+    assert peak.call_count == 1
+    assert 0 < start < 4000 and 12000 < end <= len(audio)
+
+
 def test_process_recording():
     """Test complete audio processing pipeline."""
     # Create stereo audio at 44.1kHz (samples x channels)
@@ -121,6 +256,20 @@ def test_process_recording():
     assert np.max(np.abs(processed)) <= 1.0
 
 
+def test_process_recording_does_not_modify_input():
+    """Normalization must not scale the caller's array when no copy was made upstream."""
+    audio = np.full(16000, 0.1, dtype=np.float32)
+    original = audio.copy()
+
+    processed = AudioProcessor.process_recording(
+        audio, sample_rate=16000, target_rate=16000, normalize=True,
+        trim_silence_enabled=True,
+    )
+
+    np.testing.assert_array_equal(audio, original)
+    assert np.max(np.abs(processed)) == pytest.approx(0.95, abs=1e-6)
+
+
 def test_process_recording_empty():
     """Test processing pipeline with empty audio."""
     empty = np.array([], dtype=np.float32)
@@ -203,6 +352,24 @@ def test_noise_gate_hold_keeps_gate_open():
         assert result[after_hold_start:].max() < 0.01
 
 
+def test_noise_gate_reuses_coefficients_until_parameters_change():
+    """Derived gate constants are computed once per sample rate and parameter set."""
+    import numpy as np
+    from whisper_aloud.audio.audio_processor import NoiseGate
+    gate = NoiseGate(threshold_db=-30.0)
+    chunk = np.zeros(160, dtype=np.float32)
+
+    gate.process(chunk, 16000)
+    coeffs = gate._coeffs
+    gate.process(chunk, 16000)
+    assert gate._coeffs is coeffs
+
+    gate.threshold_db = -20.0
+    gate.process(chunk, 16000)
+    assert gate._coeffs is not coeffs
+    assert gate._coeffs[0] == pytest.approx(0.1)
+
+
 # ── M2: AGC default max_gain_db ──────────────────────────────────────────────
 
 def test_agc_default_max_gain_is_20db():
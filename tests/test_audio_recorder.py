@@ -54,7 +54,8 @@ def test_start_stop_recording(mock_stream, mock_validate):
     assert recorder.state == RecordingState.RECORDING
 
     # Simulate some frames
-    recorder._frames = [np.zeros(1600, dtype=np.float32) for _ in range(10)]
+    for _ in range(10):
+        recorder._audio_callback(np.zeros((1600, 1), dtype=np.float32), 1600, None, None)
 
     # Stop recording
     audio = recorder.stop()
@@ -105,12 +106,13 @@ def test_cancel_recording(mock_stream, mock_validate):
     recorder = AudioRecorder(config)
 
     recorder.start()
-    recorder._frames = [np.ones(100, dtype=np.float32)]  # Add some data
+    recorder._audio_callback(np.ones((100, 1), dtype=np.float32), 100, None, None)  # Add some data
 
     recorder.cancel()
 
     assert recorder.state == RecordingState.IDLE
-    assert len(recorder._frames) == 0  # Data should be cleared
+    assert recorder._buffer is None  # Data should be cleared
+    assert recorder._write_pos == 0
     mock_stream_instance.stop.assert_called_once()
     mock_stream_instance.close.assert_called_once()
 
@@ -199,7 +201,7 @@ def test_stop_processing_failure(mock_stream, mock_validate, mock_pipeline_proce
     recorder = AudioRecorder(config)
 
     recorder.start()
-    recorder._frames = [np.ones(100, dtype=np.float32)]
+    recorder._audio_callback(np.ones((100, 1), dtype=np.float32), 100, None, None)
 
     with pytest.raises(AudioRecordingError, match="Failed to stop"):
         recorder.stop()
@@ -231,13 +233,13 @@ def test_stopping_state_exists():
 
 @patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
 @patch('sounddevice.InputStream')
-def test_stop_closes_stream_before_concatenating_frames(mock_stream, mock_validate):
-    """Stream must be closed before frames are read — no callback can append after close."""
+def test_stop_closes_stream_before_reading_buffer(mock_stream, mock_validate):
+    """Stream must be closed before the buffer is read — no callback can write after close."""
     mock_device = Mock()
     mock_device.name = "Test Mic"
     mock_validate.return_value = mock_device
 
-    close_called_before_concat = []
+    close_called_before_read = []
     mock_stream_instance = Mock()
     mock_stream.return_value = mock_stream_instance
 
@@ -245,23 +247,61 @@ def test_stop_closes_stream_before_concatenating_frames(mock_stream, mock_valida
     recorder = AudioRecorder(config)
     recorder.start()
 
-    # Inject one frame so stop() has data to process
-    recorder._frames = [np.zeros(160, dtype=np.float32)]
+    # Inject one block so stop() has data to process
+    recorder._audio_callback(np.zeros((160, 1), dtype=np.float32), 160, None, None)
 
-    # Patch np.concatenate to detect when it's called relative to stream.close()
-    import numpy as _np
-    original_concat = _np.concatenate
+    def process(audio, sample_rate):
+        # By the time recorded audio reaches the pipeline, stream must be closed
+        close_called_before_read.append(mock_stream_instance.close.called)
+        return audio
 
-    def patched_concat(arrays, *args, **kwargs):
-        # At the moment of concatenation, stream should already be closed
-        close_called_before_concat.append(mock_stream_instance.close.called)
-        return original_concat(arrays, *args, **kwargs)
+    recorder._pipeline.process = process
+    recorder.stop()
 
-    with patch('whisper_aloud.audio.recorder.np.concatenate', side_effect=patched_concat):
-        recorder.stop()
+    assert close_called_before_read, "Recorded audio never reached the pipeline"
+    assert all(close_called_before_read), "Stream was not closed before the buffer was read"
 
-    assert close_called_before_concat, "np.concatenate was never called"
-    assert all(close_called_before_concat), "Stream was not closed before frames were concatenated"
+
+@patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
+@patch('sounddevice.InputStream')
+def test_callback_writes_into_preallocated_buffer(mock_stream, mock_validate):
+    """Callback copies blocks into one contiguous buffer; stop() returns exactly that audio."""
+    mock_validate.return_value = Mock()
+    mock_stream.return_value = Mock()
+
+    recorder = AudioRecorder(AudioConfig(vad_enabled=False))
+    recorder._pipeline.process = lambda audio, sample_rate: audio
+    recorder.start()
+    buffer = recorder._buffer
+
+    blocks = [np.full((1600, 1), i, dtype=np.float32) for i in range(3)]
+    for block in blocks:
+        recorder._audio_callback(block, 1600, None, None)
+
+    assert recorder._buffer is buffer
+    assert recorder._write_pos == 4800
+
+    audio = recorder.stop()
+    np.testing.assert_array_equal(audio, np.concatenate([b[:, 0] for b in blocks]))
+
+
+@patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
+@patch('sounddevice.InputStream')
+def test_buffer_overflow_triggers_stop(mock_stream, mock_validate):
+    """A full buffer stops recording even if the wall-clock limit has not been reached."""
+    mock_validate.return_value = Mock()
+    mock_stream.return_value = Mock()
+
+    config = AudioConfig(max_recording_duration=0.2, chunk_duration=0.1)
+    recorder = AudioRecorder(config)
+    recorder.start()
+
+    with patch.object(recorder, '_auto_stop'):
+        for _ in range(5):
+            recorder._audio_callback(np.zeros((1600, 1), dtype=np.float32), 1600, None, None)
+
+    assert recorder._write_pos == recorder._buffer.shape[0]
+    assert recorder.state == RecordingState.STOPPING
 
 
 @patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
@@ -280,7 +320,6 @@ def test_max_duration_triggers_full_stop_path(mock_stream, mock_validate):
     recorder = AudioRecorder(config)
     recorder.start()
     recorder._start_time = _time.time() - 1.0  # force elapsed > max
-    recorder._frames = [np.zeros(160, dtype=np.float32)]
 
     # Trigger callback — should schedule auto-stop thread
     recorder._audio_callback(np.zeros((160, 1), dtype=np.float32), 160, None, None)
@@ -290,3 +329,75 @@ def test_max_duration_triggers_full_stop_path(mock_stream, mock_validate):
 
     assert recorder.state == RecordingState.IDLE, f"Expected IDLE, got {recorder.state}"
     assert recorder._stream is None, "Stream was not closed by auto-stop"
+
+
+@patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
+@patch('sounddevice.InputStream')
+def test_stream_opened_mono(mock_stream, mock_validate):
+    """The input stream is opened with a single channel regardless of config.channels."""
+    mock_validate.return_value = Mock()
+    mock_stream.return_value = Mock()
+
+    recorder = AudioRecorder(AudioConfig(channels=2))
+    recorder.start()
+
+    assert mock_stream.call_args.kwargs['channels'] == 1
+    assert mock_validate.call_args.args[2] == 1
+    recorder.cancel()
+
+
+@patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
+@patch('sounddevice.InputStream')
+def test_level_callback_runs_off_audio_thread(mock_stream, mock_validate):
+    """Levels are computed and reported on the level thread, not inside the audio callback."""
+    import threading
+
+    mock_validate.return_value = Mock()
+    mock_stream.return_value = Mock()
+
+    reported = threading.Event()
+    callers = []
+
+    def level_callback(level):
+        callers.append(threading.current_thread())
+        reported.set()
+
+    recorder = AudioRecorder(AudioConfig(), level_callback=level_callback)
+    recorder.start()
+    recorder._audio_callback(np.full((1600, 1), 0.5, dtype=np.float32), 1600, None, None)
+
+    assert reported.wait(timeout=2.0), "Level callback was never invoked"
+    assert callers[0] is not threading.current_thread()
+
+    recorder.cancel()
+    assert recorder._level_thread is None
+
+
+@patch('whisper_aloud.audio.device_manager.DeviceManager.validate_device')
+@patch('sounddevice.InputStream')
+def test_level_callback_can_be_set_and_cleared_while_recording(mock_stream, mock_validate):
+    """A callback assigned after start() fires; clearing it mid-recording is not an error."""
+    import threading
+
+    mock_validate.return_value = Mock()
+    mock_stream.return_value = Mock()
+
+    recorder = AudioRecorder(AudioConfig())
+    recorder.start()
+
+    reported = threading.Event()
+    recorder.level_callback = lambda level: reported.set()
+    recorder._audio_callback(np.full((1600, 1), 0.5, dtype=np.float32), 1600, None, None)
+    assert reported.wait(timeout=2.0), "Callback set after start() was never invoked"
+
+    reported.clear()
+    with patch('whisper_aloud.audio.recorder.logger') as mock_logger:
+        recorder.level_callback = None
+        recorder._audio_callback(np.full((1600, 1), 0.5, dtype=np.float32), 1600, None, None)
+        # The level thread handles blocks in order: once this one is reported,
+        # the block queued while the callback was cleared has been handled
+        recorder.level_callback = lambda level: reported.set()
+        recorder._audio_callback(np.full((1600, 1), 0.5, dtype=np.float32), 1600, None, None)
+        assert reported.wait(timeout=2.0)
+    mock_logger.error.assert_not_called()
+    recorder.cancel()
@@ -3,7 +3,9 @@
 import os
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
 
 from whisper_aloud import ClipboardConfig, ClipboardManager, PasteSimulator
 
@@ -64,8 +66,52 @@ class TestClipboardCopy:
             # Verify stdin was written to
             mock_process.stdin.write.assert_called_once_with(b"Test text")
             mock_process.stdin.close.assert_called_once()
-            # Verify fallback was also called for redundancy
-            mock_fallback.assert_called_once_with("Test text")
+            # No redundant fallback file by default
+            mock_fallback.assert_not_called()
+
+    @patch('subprocess.run')
+    @patch.dict(os.environ, {"DISPLAY": ":0", "WAYLAND_DISPLAY": ""}, clear=False)
+    def test_copy_success_fallback_on_success(self, mock_run, tmp_path):
+        """With fallback_on_success, the fallback file is written in the background."""
+        mock_run.return_value = MagicMock(returncode=0)
+        fallback_path = tmp_path / "clipboard.txt"
+        config = ClipboardConfig(fallback_on_success=True, fallback_path=str(fallback_path))
+        manager = ClipboardManager(config)
+
+        assert manager.copy("Test text") is True
+        manager._fallback_executor.shutdown(wait=True)
+        assert fallback_path.read_text(encoding='utf-8') == "Test text"
+
+    @patch('subprocess.Popen')
+    @patch.dict(os.environ, {"WAYLAND_DISPLAY": ":0"}, clear=False)
+    def test_copy_wayland_reaps_finished_wl_copy(self, mock_popen):
+        """wl-copy output is discarded, and an exited previous wl-copy is reaped on the next copy."""
+        first, second = MagicMock(), MagicMock()
+        first.poll.return_value = 0  # already served its paste
+        mock_popen.side_effect = [first, second]
+
+        manager = ClipboardManager(ClipboardConfig())
+        with patch.object(manager, '_copy_fallback', return_value=True):
+            manager.copy("one")
+            manager.copy("two")
+
+        first.poll.assert_called_once()
+        assert manager._wl_copy is second
+        assert mock_popen.call_args.kwargs['stdout'] is subprocess.DEVNULL
+        assert mock_popen.call_args.kwargs['stderr'] is subprocess.DEVNULL
+
+    @patch('subprocess.Popen')
+    @patch.dict(os.environ, {"WAYLAND_DISPLAY": ":0"}, clear=False)
+    def test_copy_wayland_execs_resolved_path(self, mock_popen):
+        """wl-copy is looked up on PATH once, at init, and exec'd by absolute path."""
+        with patch('shutil.which', return_value='/usr/bin/wl-copy') as mock_which:
+            manager = ClipboardManager(ClipboardConfig())
+        with patch.object(manager, '_copy_fallback', return_value=True):
+            manager.copy("one")
+            manager.copy("two")
+
+        assert mock_which.call_count == 2  # wl-copy and xclip, once each
+        assert mock_popen.call_args.args[0] == ('/usr/bin/wl-copy', '--paste-once')
 
     @patch('subprocess.run')
     @patch.dict(os.environ, {"DISPLAY": ":0", "WAYLAND_DISPLAY": ""}, clear=False)
@@ -84,6 +130,11 @@ class TestClipboardCopy:
             assert mock_run.call_count >= 1
             call_args = str(mock_run.call_args_list[0])
             assert 'xclip' in call_args
+            # The forked xclip keeps inherited pipes open: output must not be captured
+            kwargs = mock_run.call_args_list[0].kwargs
+            assert kwargs['stdout'] is subprocess.DEVNULL
+            assert kwargs['stderr'] is subprocess.DEVNULL
+            assert 'capture_output' not in kwargs
 
     @patch('subprocess.Popen')
     @patch.dict(os.environ, {"WAYLAND_DISPLAY": ":0"}, clear=False)
@@ -97,9 +148,9 @@ class TestClipboardCopy:
         with patch.object(manager, '_copy_fallback', return_value=True) as mock_fallback:
             result = manager.copy("Test text")
 
-            # Should succeed via fallback
+            # Should succeed via fallback, reusing the encoded text
             assert result is True
-            mock_fallback.assert_called_once_with("Test text")
+            mock_fallback.assert_called_once_with("Test text", b"Test text")
 
     @patch('subprocess.Popen')
     @patch.dict(os.environ, {"WAYLAND_DISPLAY": ":0"}, clear=False)
@@ -116,9 +167,9 @@ class TestClipboardCopy:
         with patch.object(manager, '_copy_fallback', return_value=True) as mock_fallback:
             result = manager.copy("Test text")
 
-            # Should succeed via fallback
+            # Should succeed via fallback, reusing the encoded text
             assert result is True
-            mock_fallback.assert_called_once_with("Test text")
+            mock_fallback.assert_called_once_with("Test text", b"Test text")
 
     @patch('subprocess.run')
     @patch.dict(os.environ, {"DISPLAY": "", "WAYLAND_DISPLAY": ""}, clear=False)
@@ -181,7 +232,7 @@ class TestFallback:
         # Cleanup
         fallback_path.unlink()
 
-    @patch('pathlib.Path.write_text')
+    @patch('whisper_aloud.clipboard.clipboard_manager._write_bytes')
     def test_fallback_emergency_path(self, mock_write):
         """Test emergency fallback when primary fallback fails."""
         # First call fails, second call succeeds
@@ -195,6 +246,26 @@ class TestFallback:
         # Should succeed via emergency path
         assert result is True
         assert mock_write.call_count == 2
+        assert mock_write.call_args.args == ("/tmp/whisper_clipboard.txt", b"Test")
+
+    def test_fallback_overwrites_and_is_private(self, tmp_path):
+        """Fallback truncates previous contents and creates the file owner-only."""
+        fallback_path = tmp_path / "clipboard.txt"
+        manager = ClipboardManager(ClipboardConfig(fallback_path=str(fallback_path)))
+
+        assert manager._copy_fallback("a much longer first text") is True
+        assert manager._copy_fallback("short") is True
+
+        assert fallback_path.read_text(encoding='utf-8') == "short"
+        assert fallback_path.stat().st_mode & 0o777 == 0o600
+
+    def test_fallback_writes_pre_encoded_bytes(self, tmp_path):
+        """Bytes passed in by the copy path are written as-is, not re-encoded."""
+        fallback_path = tmp_path / "clipboard.txt"
+        manager = ClipboardManager(ClipboardConfig(fallback_path=str(fallback_path)))
+
+        assert manager._copy_fallback("ñandú", "ñandú".encode('utf-8')) is True
+        assert fallback_path.read_bytes() == "ñandú".encode('utf-8')
 
 
 class TestPasteSimulation:
@@ -286,11 +357,31 @@ class TestPasteSimulation:
 class TestPermissionChecks:
     """Test permission checking logic."""
 
-    @patch('subprocess.run')
-    def test_check_tool_available(self, mock_run):
+    @pytest.fixture(autouse=True)
+    def _fresh_probes(self):
+        """Environment probes are cached per process; start each test clean.
+
+        pydbus is hidden so service checks take the (mocked) systemctl path
+        instead of querying the developer's real buses.
+        """
+        import sys
+
+        from whisper_aloud.clipboard import paste_simulator
+        probes = (
+            paste_simulator._which,
+            paste_simulator._ydotool_service_active,
+            paste_simulator._user_in_input_group,
+        )
+        for probe in probes:
+            probe.cache_clear()
+        with patch.dict(sys.modules, {'pydbus': None}):
+            yield
+        for probe in probes:
+            probe.cache_clear()
+
+    @patch('shutil.which', return_value='/usr/bin/xdotool')
+    def test_check_tool_available(self, mock_which):
         """Test checking when tool is available."""
-        mock_run.return_value = MagicMock(returncode=0)
-
         config = ClipboardConfig()
         simulator = PasteSimulator('x11', config)
         status = simulator.check_availability()
@@ -298,12 +389,11 @@ class TestPermissionChecks:
         assert status['available'] is True
         assert status['reason'] == ''
         assert status['fix'] == ''
+        mock_which.assert_called_once_with('xdotool')
 
-    @patch('subprocess.run')
-    def test_check_tool_not_installed(self, mock_run):
+    @patch('shutil.which', return_value=None)
+    def test_check_tool_not_installed(self, mock_which):
         """Test checking when tool is not installed."""
-        mock_run.return_value = MagicMock(returncode=1)
-
         config = ClipboardConfig()
         simulator = PasteSimulator('wayland', config)
         status = simulator.check_availability()
@@ -312,17 +402,136 @@ class TestPermissionChecks:
         assert 'not installed' in status['reason']
         assert 'sudo apt install' in status['fix']
 
-    @patch('subprocess.run')
-    def test_check_timeout(self, mock_run):
-        """Test checking with timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired('which', 2)
+    @staticmethod
+    def _systemctl(returncode):
+        """Popen side effect: a finished systemctl with the given exit code."""
+        def spawn(*args, **kwargs):
+            proc = MagicMock()
+            proc.wait.return_value = returncode
+            proc.poll.return_value = returncode
+            return proc
+        return spawn
 
-        config = ClipboardConfig()
-        simulator = PasteSimulator('wayland', config)
+    @patch('subprocess.Popen')
+    @patch('shutil.which', return_value='/usr/bin/ydotool')
+    def test_check_service_not_running(self, mock_which, mock_popen):
+        """Wayland check reports an inactive ydotool service (user and system units)."""
+        mock_popen.side_effect = self._systemctl(3)
+
+        simulator = PasteSimulator('wayland', ClipboardConfig())
         status = simulator.check_availability()
 
         assert status['available'] is False
-        assert 'Timeout' in status['reason']
+        assert 'service not running' in status['reason']
+        commands = [c.args[0] for c in mock_popen.call_args_list]
+        assert ['systemctl', '--user', 'is-active', 'ydotool.service'] in commands
+        assert ['systemctl', 'is-active', 'ydotool.service'] in commands
+
+    @patch('subprocess.Popen')
+    @patch('shutil.which', return_value='/usr/bin/ydotool')
+    def test_check_service_probes_run_concurrently(self, mock_which, mock_popen):
+        """Both systemctl probes are started before either is waited on."""
+        events = []
+
+        def spawn(cmd, **kwargs):
+            events.append('spawn')
+            proc = MagicMock()
+            proc.wait.side_effect = lambda timeout=None: events.append('wait') or 0
+            return proc
+
+        mock_popen.side_effect = spawn
+        status = PasteSimulator('wayland', ClipboardConfig())._check_ydotool_permissions()
+
+        assert events[:2] == ['spawn', 'spawn']
+        assert 'service' not in status['reason']
+
+    @patch('subprocess.Popen')
+    @patch('shutil.which', return_value='/usr/bin/ydotool')
+    def test_check_probes_cached_until_refresh(self, mock_which, mock_popen):
+        """Positive probe results are reused; negative ones are re-probed; refresh=True re-runs all."""
+        mock_popen.side_effect = self._systemctl(3)
+        simulator = PasteSimulator('wayland', ClipboardConfig())
+
+        simulator.check_availability()
+        simulator.check_availability()
+        assert mock_which.call_count == 1  # tool found: cached
+        assert mock_popen.call_count == 4  # service inactive: asked again
+
+        # ydotoold started after launch: noticed without a refresh
+        mock_popen.side_effect = self._systemctl(0)
+        simulator.check_availability()
+        simulator.check_availability()
+        assert mock_popen.call_count == 6  # active: cached from now on
+
+        simulator.check_availability(refresh=True)
+        assert mock_which.call_count == 2
+        assert mock_popen.call_count == 8
+
+    @patch('shutil.which')
+    def test_missing_tool_noticed_once_installed(self, mock_which):
+        """A tool reported missing is looked up again on the next check."""
+        mock_which.return_value = None
+        simulator = PasteSimulator('x11', ClipboardConfig())
+        assert not simulator.check_availability()['available']
+
+        mock_which.return_value = '/usr/bin/xdotool'
+        assert simulator.check_availability()['available']
+
+    @patch('subprocess.Popen')
+    def test_check_service_via_dbus(self, mock_popen):
+        """With pydbus, ActiveState is read over D-Bus (user bus, then system) without forking."""
+        import sys
+        from types import SimpleNamespace
+
+        from whisper_aloud.clipboard import paste_simulator
+
+        def make_bus(state):
+            def get(name, path=None):
+                if path is None:
+                    if state is None:
+                        return SimpleNamespace(GetUnit=Mock(side_effect=Exception(
+                            'GDBus.Error:org.freedesktop.systemd1.NoSuchUnit: not loaded')))
+                    return SimpleNamespace(GetUnit=Mock(return_value='/unit/ydotool'))
+                return SimpleNamespace(ActiveState=state)
+            return SimpleNamespace(get=get)
+
+        fake_pydbus = SimpleNamespace(
+            SessionBus=lambda: make_bus(None),      # no user unit
+            SystemBus=lambda: make_bus('active'),   # system unit running
+        )
+        with patch.dict(sys.modules, {'pydbus': fake_pydbus}):
+            assert paste_simulator._ydotool_service_active() is True
+        mock_popen.assert_not_called()
+
+    def test_input_group_membership_by_name(self):
+        """Membership is a single getgrnam lookup; a missing group means not a member."""
+        from whisper_aloud.clipboard import paste_simulator
+
+        with patch('grp.getgrnam', return_value=MagicMock(gr_gid=104)) as getgrnam, \
+                patch('grp.getgrgid') as getgrgid, \
+                patch('os.getgroups', return_value=[1000, 104]):
+            assert paste_simulator._user_in_input_group() is True
+            getgrnam.assert_called_once_with('input')
+            getgrgid.assert_not_called()
+
+        paste_simulator._user_in_input_group.cache_clear()
+        with patch('grp.getgrnam', side_effect=KeyError('input')):
+            assert paste_simulator._user_in_input_group() is False
+
+    @patch('subprocess.Popen')
+    @patch('shutil.which', return_value='/usr/bin/ydotool')
+    def test_check_service_timeout_not_fatal(self, mock_which, mock_popen):
+        """An undeterminable service state does not by itself block paste; probes are killed."""
+        proc = MagicMock()
+        proc.wait.side_effect = [subprocess.TimeoutExpired('systemctl', 2), None, None]
+        proc.poll.return_value = None
+        mock_popen.return_value = proc
+
+        simulator = PasteSimulator('wayland', ClipboardConfig())
+        status = simulator.check_availability()
+
+        assert 'service' not in status['reason']
+        assert proc.kill.call_count == 2
 
 
 class TestConfiguration:
@@ -236,3 +236,329 @@ def test_clipboard_config_paste_shortcut_roundtrip():
     assert data["clipboard"]["paste_shortcut"] == "ctrl+shift+v"
     restored = WhisperAloudConfig.from_dict(data)
     assert restored.clipboard.paste_shortcut == "ctrl+shift+v"
+
+
+def test_clipboard_config_fallback_on_success_roundtrip():
+    """fallback_on_success defaults off and survives to_dict / from_dict."""
+    from whisper_aloud.config import WhisperAloudConfig
+    config = WhisperAloudConfig()
+    assert config.clipboard.fallback_on_success is False
+    config.clipboard.fallback_on_success = True
+    restored = WhisperAloudConfig.from_dict(config.to_dict())
+    assert restored.clipboard.fallback_on_success is True
+
+
+def test_clipboard_config_prefer_type_over_paste(monkeypatch):
+    """prefer_type_over_paste defaults off, roundtrips and reads its env var."""
+    from whisper_aloud.config import WhisperAloudConfig
+    config = WhisperAloudConfig()
+    assert config.clipboard.prefer_type_over_paste is False
+    config.clipboard.prefer_type_over_paste = True
+    restored = WhisperAloudConfig.from_dict(config.to_dict())
+    assert restored.clipboard.prefer_type_over_paste is True
+
+    monkeypatch.setenv("WHISPER_ALOUD_CLIPBOARD_PREFER_TYPE_OVER_PASTE", "true")
+    config = WhisperAloudConfig()
+    config._apply_env_overrides()
+    assert config.clipboard.prefer_type_over_paste is True
+
+
+def test_load_is_memoized_until_file_or_env_changes(tmp_path, monkeypatch):
+    """load() skips re-reading the file until it, or the env overrides, change."""
+    import json
+    from unittest.mock import patch
+
+    config_file = tmp_path / ".config" / "whisper_aloud" / "config.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text(json.dumps({"model": {"name": "tiny"}}))
+
+    from whisper_aloud import config as config_module
+
+    with patch.object(config_module, "_parse_json", wraps=config_module._parse_json) as parse:
+        first = WhisperAloudConfig.load()
+        second = WhisperAloudConfig.load()
+        assert parse.call_count == 1
+        assert second.model.name == "tiny"
+        assert second is not first and second.model is not first.model
+
+        config_file.write_text(json.dumps({"model": {"name": "small"}}))
+        assert WhisperAloudConfig.load().model.name == "small"
+        assert parse.call_count == 2
+
+        monkeypatch.setenv("WHISPER_ALOUD_MODEL_NAME", "medium")
+        assert WhisperAloudConfig.load().model.name == "medium"
+
+        WhisperAloudConfig.reload()
+        assert parse.call_count == 4
+
+
+def test_from_dict_ignores_unknown_keys_and_restores_paths():
+    """from_dict applies known fields only and turns persistence paths back into Path."""
+    from pathlib import Path
+
+    config = WhisperAloudConfig.from_dict({
+        "model": {"name": "tiny", "bogus": 1},
+        "persistence": {"db_path": "/tmp/h.db", "audio_archive_path": None},
+        "unknown_section": {"name": "x"},
+    })
+    assert config.model.name == "tiny"
+    assert not hasattr(config.model, "bogus")
+    assert config.persistence.db_path == Path("/tmp/h.db")
+    assert config.persistence.audio_archive_path is None
+
+
+def test_load_with_config_file_builds_config_once(tmp_path):
+    """With a config file present, load() doesn't build a throwaway default config."""
+    import json
+    from unittest.mock import patch
+
+    config_file = tmp_path / ".config" / "whisper_aloud" / "config.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text(json.dumps({"model": {"name": "tiny"}}))
+
+    with patch("whisper_aloud.config.PersistenceConfig.__post_init__", autospec=True,
+               side_effect=lambda self: None) as post_init:
+        config = WhisperAloudConfig.reload()
+    assert config.model.name == "tiny"
+    # One for the loaded config, one for the cached copy
+    assert post_init.call_count == 2
+
+
+def test_load_corrupted_file_falls_back_to_defaults(tmp_path):
+    """An unreadable config file still yields the default config."""
+    config_file = tmp_path / ".config" / "whisper_aloud" / "config.json"
+    config_file.parent.mkdir(parents=True)
+    config_file.write_text("{not json")
+
+    assert WhisperAloudConfig.reload().model.name == "base"
+
+
+def test_config_module_defers_json_import():
+    """json is imported on demand by load()/save(), not at module import."""
+    import whisper_aloud.config as config_module
+
+    assert not hasattr(config_module, "json")
+
+
+def test_env_overrides_table_edge_cases(monkeypatch):
+    """Empty optional values are ignored; invalid numbers keep the current value."""
+    from pathlib import Path
+
+    monkeypatch.setenv("WHISPER_ALOUD_DEVICE_ID", "")
+    monkeypatch.setenv("WHISPER_ALOUD_DB_PATH", "")
+    monkeypatch.setenv("WHISPER_ALOUD_AUDIO_ARCHIVE", "/tmp/archive")
+    monkeypatch.setenv("WHISPER_ALOUD_CLEANUP_DAYS", "soon")
+    monkeypatch.setenv("WHISPER_ALOUD_MODEL_DOWNLOAD_ROOT", "/models")
+
+    config = WhisperAloudConfig()
+    default_db = config.persistence.db_path
+    config._apply_env_overrides()
+
+    assert config.audio.device_id is None
+    assert config.persistence.db_path == default_db
+    assert config.persistence.audio_archive_path == Path("/tmp/archive")
+    assert config.persistence.auto_cleanup_days == 90
+    assert config.model.download_root == "/models"
+
+
+def test_validate_rejects_unhashable_choice_values():
+    """A JSON list where a name is expected fails validation rather than raising TypeError."""
+    config = WhisperAloudConfig.from_dict({"model": {"name": ["base"]}})
+    with pytest.raises(ConfigurationError, match="Invalid model name"):
+        config.validate()
+
+
+def test_config_dataclasses_are_slotted():
+    """Config sections use __slots__: no per-instance __dict__, typos raise."""
+    config = WhisperAloudConfig()
+    for section in (config, config.model, config.audio, config.persistence):
+        assert not hasattr(section, "__dict__")
+    with pytest.raises(AttributeError):
+        config.audio.sample_rat = 8000
+
+
+def test_parse_json_prefers_orjson_and_falls_back(monkeypatch):
+    """Config files are parsed with orjson when installed, stdlib json otherwise."""
+    import sys
+    import types
+
+    from whisper_aloud.config import _parse_json
+
+    fake = types.ModuleType("orjson")
+    fake.loads = lambda raw: {"parsed_by": "orjson"}
+    monkeypatch.setitem(sys.modules, "orjson", fake)
+    assert _parse_json(b'{}') == {"parsed_by": "orjson"}
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert _parse_json('{"a": "ñ"}'.encode()) == {"a": "ñ"}
+
+
+def test_save_writes_indented_json_that_loads_back(tmp_path, monkeypatch):
+    """save() writes 2-space indented JSON (stdlib fallback here) that load() reads back."""
+    import sys
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    config = WhisperAloudConfig()
+    config.model.name = "small"
+
+    config_file = config.save()
+    assert config_file.read_text().startswith('{\n  "model": {\n    "name": "small"')
+    assert WhisperAloudConfig.load().model.name == "small"
+
+
+def test_parse_bool_env_values(monkeypatch):
+    """Boolean env values: case/whitespace-insensitive, unset or invalid keep the default."""
+    from whisper_aloud.config import parse_bool_env
+
+    for raw, expected in (("TRUE", True), (" on ", True), ("1", True), ("No", False), ("", False)):
+        monkeypatch.setenv("WHISPER_ALOUD_TEST_BOOL", raw)
+        assert parse_bool_env("WHISPER_ALOUD_TEST_BOOL", not expected) is expected
+
+    monkeypatch.setenv("WHISPER_ALOUD_TEST_BOOL", "maybe")
+    assert parse_bool_env("WHISPER_ALOUD_TEST_BOOL", True) is True
+    monkeypatch.delenv("WHISPER_ALOUD_TEST_BOOL")
+    assert parse_bool_env("WHISPER_ALOUD_TEST_BOOL", False) is False
+
+
+def test_validation_rules_reference_real_fields():
+    """Every declarative validation rule names an existing config field."""
+    from whisper_aloud.config import _SECTION_FIELDS, _VALIDATION_RULES
+
+    for section, name, _, _ in _VALIDATION_RULES:
+        assert name in _SECTION_FIELDS[section], f"{section}.{name}"
+
+
+def test_validate_range_message():
+    """Rule messages are formatted with the offending value."""
+    config = WhisperAloudConfig()
+    config.audio.sample_rate = 96000
+    with pytest.raises(ConfigurationError, match="Invalid sample rate 96000. Must be 8000-48000 Hz"):
+        config.validate()
+
+
+def test_copy_is_independent_and_skips_dict_roundtrip():
+    """copy() clones each section directly and shares no mutable state."""
+    from unittest.mock import patch
+
+    config = WhisperAloudConfig()
+    config.model.name = "tiny"
+    config.clipboard.paste_delay_ms = 7
+
+    with patch.object(WhisperAloudConfig, "to_dict") as to_dict:
+        clone = config.copy()
+    to_dict.assert_not_called()
+
+    assert clone == config
+    clone.model.name = "small"
+    assert config.model.name == "tiny"
+    assert clone.persistence is not config.persistence
+
+
+def test_config_file_path_memoized_per_home(tmp_path, monkeypatch):
+    """The config path follows $HOME but is only resolved once per home."""
+    from whisper_aloud.config import _user_config_file
+
+    first = _user_config_file()
+    assert first == tmp_path / ".config" / "whisper_aloud" / "config.json"
+    assert _user_config_file() is first
+
+    monkeypatch.setenv("HOME", str(tmp_path / "other"))
+    assert _user_config_file() == tmp_path / "other" / ".config" / "whisper_aloud" / "config.json"
+
+
+def test_load_without_config_file_does_not_probe_existence():
+    """load() opens the config file directly instead of checking exists() first."""
+    from unittest.mock import patch
+
+    with patch("pathlib.Path.exists") as exists:
+        config = WhisperAloudConfig.reload()
+    exists.assert_not_called()
+    assert config.model.name == "base"
+
+
+def test_env_override_table_skipped_without_prefixed_vars(monkeypatch):
+    """With no WHISPER_ALOUD_* variables set, load() doesn't walk the override table."""
+    from unittest.mock import patch
+
+    for name in list(os.environ):
+        if name.startswith("WHISPER_ALOUD_"):
+            monkeypatch.delenv(name)
+
+    with patch.object(WhisperAloudConfig, "_apply_env_overrides") as apply:
+        WhisperAloudConfig.reload()
+        apply.assert_not_called()
+
+        monkeypatch.setenv("WHISPER_ALOUD_BEAM_SIZE", "3")
+        WhisperAloudConfig.load()
+        apply.assert_called_once()
+
+
+def test_validate_reports_all_errors():
+    """validate() reports every invalid value in one ConfigurationError."""
+    config = WhisperAloudConfig()
+    config.model.device = "tpu"
+    config.audio.channels = 6
+    config.clipboard.paste_delay_ms = -1
+
+    with pytest.raises(ConfigurationError) as excinfo:
+        config.validate()
+    message = str(excinfo.value)
+    assert message.startswith("Invalid device 'tpu'")
+    assert "Invalid channels 6" in message
+    assert message.endswith("Invalid paste delay -1. Must be >= 0")
+
+
+def test_env_overrides_read_from_snapshot(monkeypatch):
+    """_apply_env_overrides can read a prefix-filtered snapshot instead of os.environ."""
+    monkeypatch.setenv("WHISPER_ALOUD_BEAM_SIZE", "2")
+    config = WhisperAloudConfig()
+    config._apply_env_overrides({"WHISPER_ALOUD_BEAM_SIZE": "7"})
+    assert config.transcription.beam_size == 7
+
+
+def test_to_dict_covers_every_field_in_declaration_order():
+    """to_dict() is derived from the dataclass fields, with paths as strings."""
+    from dataclasses import fields
+
+    config = WhisperAloudConfig()
+    data = config.to_dict()
+    for section, values in data.items():
+        assert list(values) == [f.name for f in fields(getattr(config, section))]
+    assert data["persistence"]["db_path"] == str(config.persistence.db_path)
+    assert WhisperAloudConfig.from_dict(data) == config
+
+
+def test_detect_config_changes_reports_fields_and_flags():
+    """detect_config_changes() lists changed fields per section and sets reload/reinit flags."""
+    from whisper_aloud.config import detect_config_changes
+
+    old = WhisperAloudConfig()
+    assert not detect_config_changes(old, old.copy())
+
+    new = old.copy()
+    new.transcription.beam_size = 3
+    new.clipboard.auto_paste = not old.clipboard.auto_paste
+    changes = detect_config_changes(old, new)
+    assert changes.changed_fields == {"transcription": {"beam_size"}, "clipboard": {"auto_paste"}}
+    assert not changes.requires_model_reload
+    assert not changes.requires_audio_reinit
+
+    new.transcription.language = "fr"
+    new.audio.sample_rate = 44100
+    changes = detect_config_changes(old, new)
+    assert changes.changed_fields["transcription"] == {"beam_size", "language"}
+    assert changes.requires_model_reload
+    assert changes.requires_audio_reinit
+
+
+def test_detect_config_changes_same_object_short_circuits():
+    """Comparing a config with itself returns no changes without reading any section."""
+    from unittest.mock import PropertyMock, patch
+
+    from whisper_aloud.config import detect_config_changes
+
+    config = WhisperAloudConfig()
+    with patch.object(WhisperAloudConfig, "model", new_callable=PropertyMock) as model:
+        assert not detect_config_changes(config, config)
+    model.assert_not_called()
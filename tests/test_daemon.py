@@ -447,6 +447,73 @@ class TestDaemonMethods:
             daemon._transcribe_and_emit(np.zeros(16000, dtype=np.float32))
         daemon.clipboard_manager.copy.assert_called_once_with("Hello world")
 
+    def test_prefer_type_over_paste_skips_clipboard(self, daemon):
+        """With prefer_type_over_paste, auto-paste types the text instead of copying it."""
+        daemon.config.clipboard.auto_copy = True
+        daemon.config.clipboard.auto_paste = True
+        daemon.config.clipboard.prefer_type_over_paste = True
+        daemon.clipboard_manager = MagicMock()
+        daemon.clipboard_manager._session_type = "wayland"
+        mock_result = MagicMock()
+        mock_result.text = "Hello world"
+        mock_result.duration = 1.0
+        mock_result.language = "en"
+        mock_result.confidence = 0.95
+        daemon.transcriber.transcribe_numpy.return_value = mock_result
+        daemon.history_manager.add_transcription.return_value = 1
+
+        with patch.object(daemon._daemon_module, "GLib") as mock_glib, \
+                patch("whisper_aloud.clipboard.PasteSimulator") as mock_sim:
+            mock_glib.Variant = lambda t, v: v
+            mock_glib.idle_add = lambda fn, *args: fn(*args)
+            daemon._transcribe_and_emit(np.zeros(16000, dtype=np.float32))
+        daemon.clipboard_manager.copy.assert_not_called()
+        mock_sim.return_value.type_text.assert_called_once_with("Hello world")
+        mock_sim.return_value.simulate_paste.assert_not_called()
+
+    @pytest.mark.parametrize("type_outcome", [False, RuntimeError("ydotoold not running")])
+    def test_prefer_type_over_paste_falls_back_to_clipboard(self, daemon, type_outcome):
+        """If typing fails or raises, the text is copied and pasted instead of being lost."""
+        daemon.config.clipboard.auto_copy = True
+        daemon.config.clipboard.auto_paste = True
+        daemon.config.clipboard.prefer_type_over_paste = True
+        daemon.clipboard_manager = MagicMock()
+        daemon.clipboard_manager._session_type = "wayland"
+
+        with patch("whisper_aloud.clipboard.PasteSimulator") as mock_sim:
+            if isinstance(type_outcome, Exception):
+                mock_sim.return_value.type_text.side_effect = type_outcome
+            else:
+                mock_sim.return_value.type_text.return_value = type_outcome
+            daemon._deliver_text("Hello world")
+
+        mock_sim.return_value.type_text.assert_called_once_with("Hello world")
+        daemon.clipboard_manager.copy.assert_called_once_with("Hello world")
+        mock_sim.return_value.simulate_paste.assert_called_once()
+
+    def test_clipboard_delivery_runs_off_main_loop(self, daemon):
+        """Copy and paste run on the transcription worker, not in the main-loop callback."""
+        daemon.config.clipboard.auto_copy = True
+        daemon.config.clipboard.auto_paste = True
+        daemon.clipboard_manager = MagicMock()
+        mock_result = MagicMock()
+        mock_result.text = "Hello world"
+        daemon.transcriber.transcribe_numpy.return_value = mock_result
+        daemon.history_manager.add_transcription.return_value = 1
+
+        pending = []
+        with patch.object(daemon._daemon_module, "GLib") as mock_glib, \
+                patch("whisper_aloud.clipboard.PasteSimulator") as mock_sim:
+            mock_glib.Variant = lambda t, v: v
+            mock_glib.idle_add = lambda fn, *args: pending.append(fn)
+            daemon._transcribe_and_emit(np.zeros(16000, dtype=np.float32))
+
+        # The main loop has not run the success callback yet
+        assert len(pending) == 1
+        daemon.TranscriptionReady.assert_not_called()
+        daemon.clipboard_manager.copy.assert_called_once_with("Hello world")
+        mock_sim.return_value.simulate_paste.assert_called_once_with()
+
     def test_clipboard_not_called_when_disabled(self, daemon):
         """Clipboard copy should be skipped when auto_copy is disabled."""
         daemon.config.clipboard.auto_copy = False
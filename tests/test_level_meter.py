@@ -138,3 +138,52 @@ def test_audio_level_meter_attack_faster_than_release():
     assert rise > 0, "RMS should rise when signal appears"
     assert fall > 0, "RMS should fall when signal disappears"
     assert rise > fall, f"Attack ({rise:.4f}) should be faster than release ({fall:.4f})"
+
+
+def test_audio_level_meter_first_chunk_levels():
+    """First chunk (no smoothing history) reports exact RMS, peak and dB."""
+    import math
+
+    import numpy as np
+    from whisper_aloud.audio.level_meter import LevelMeter
+
+    meter = LevelMeter()
+    chunk = np.full(1600, 0.5, dtype=np.float32)
+    chunk[::2] = -0.5
+    level = meter.calculate_level(chunk)
+
+    assert level.rms == pytest.approx(0.5, rel=1e-6)
+    assert level.peak == pytest.approx(0.5, rel=1e-6)
+    assert level.db == pytest.approx(20 * math.log10(0.5), rel=1e-6)
+    assert isinstance(level.db, float)
+
+
+def test_audio_level_meter_peak_of_negative_excursion():
+    """Peak is the largest magnitude, including negative-going and 2-D (frames, 1) chunks."""
+    import numpy as np
+    from whisper_aloud.audio.level_meter import LevelMeter
+
+    chunk = np.full((1600, 1), 0.1, dtype=np.float32)
+    chunk[10, 0] = -0.75
+    assert LevelMeter().calculate_level(chunk).peak == pytest.approx(0.75)
+
+
+def test_audio_level_meter_imports_without_scipy():
+    """The level meter only needs numpy: importing it doesn't pull in scipy."""
+    import os
+    import subprocess
+    import sys
+
+    import whisper_aloud
+
+    src_dir = os.path.dirname(os.path.dirname(whisper_aloud.__file__))
+    code = (
+        "import sys; import whisper_aloud.audio.level_meter; "
+        "print('scipy' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": src_dir},
+    )
+    assert result.stdout.strip() == "False"
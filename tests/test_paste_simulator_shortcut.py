@@ -54,3 +54,93 @@ def test_x11_paste_uses_configured_shortcut():
         sim._paste_x11()
         call_args = mock_run.call_args[0][0]
         assert 'ctrl+shift+v' in call_args
+
+
+def test_wayland_paste_via_ydotoold_socket(tmp_path, monkeypatch):
+    """With ydotoold listening, key events go over its socket and ydotool is not spawned."""
+    import socket
+    import struct
+
+    from whisper_aloud.clipboard import paste_simulator
+    from whisper_aloud.clipboard.paste_simulator import PasteSimulator
+
+    sock_path = str(tmp_path / "ydotool.sock")
+    monkeypatch.setenv("YDOTOOL_SOCKET", sock_path)
+    monkeypatch.setattr(paste_simulator, "_YDOTOOL_KEY_DELAY", 0)
+    daemon = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    daemon.bind(sock_path)
+    try:
+        sim = PasteSimulator("wayland", _make_config("ctrl+v"))
+        with patch("subprocess.run") as mock_run:
+            assert sim._paste_wayland() is True
+            mock_run.assert_not_called()
+
+        event = struct.Struct("llHHi")
+        received = [event.unpack(daemon.recv(event.size))[2:] for _ in range(8)]
+    finally:
+        daemon.close()
+
+    keys = [(code, value) for ev_type, code, value in received if ev_type == 1]
+    assert keys == [(29, 1), (47, 1), (47, 0), (29, 0)]
+    assert received[1::2] == [(0, 0, 0)] * 4  # SYN_REPORT after each key
+
+
+def test_paste_commands_resolved_at_init():
+    """Paste commands are built once in __init__, not per paste."""
+    from whisper_aloud.clipboard.paste_simulator import PasteSimulator
+    sim = PasteSimulator("x11", _make_config("ctrl+shift+v"))
+    assert sim._xdotool_argv == ['xdotool', 'key', 'ctrl+shift+v']
+    assert sim._ydotool_argv == ['ydotool', 'key', '29:1', '42:1', '47:1', '47:0', '42:0', '29:0']
+    assert sim._ydotool_events[0] == (29, 1)
+
+    with patch.object(PasteSimulator, "_xdotool_shortcut") as shortcut, \
+            patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        sim._paste_x11()
+        shortcut.assert_not_called()
+        assert mock_run.call_args[0][0] is sim._xdotool_argv
+
+
+def test_paste_commands_discard_stdout():
+    """Paste commands only keep stderr (for error logging); stdout is discarded."""
+    import subprocess
+
+    from whisper_aloud.clipboard.paste_simulator import PasteSimulator
+    for session, paste in (("wayland", "_paste_wayland"), ("x11", "_paste_x11")):
+        sim = PasteSimulator(session, _make_config())
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            getattr(sim, paste)()
+            kwargs = mock_run.call_args.kwargs
+            assert kwargs["stdout"] is subprocess.DEVNULL
+            assert kwargs["stderr"] is subprocess.PIPE
+
+
+def test_type_text_runs_one_command_per_session():
+    """type_text types the whole string in a single ydotool/xdotool call."""
+    from whisper_aloud.clipboard.paste_simulator import PasteSimulator
+    expected = {
+        "wayland": ['ydotool', 'type', '--key-delay', '0', '--', '-hola mundo'],
+        "x11": ['xdotool', 'type', '--delay', '0', '--', '-hola mundo'],
+    }
+    for session, argv in expected.items():
+        sim = PasteSimulator(session, _make_config())
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            assert sim.type_text("-hola mundo") is True
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0] == argv
+
+
+def test_type_text_failure_and_unknown_session():
+    """type_text reports failures instead of raising."""
+    import subprocess
+
+    from whisper_aloud.clipboard.paste_simulator import PasteSimulator
+    sim = PasteSimulator("wayland", _make_config())
+    with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "ydotool")):
+        assert sim.type_text("hi") is False
+
+    with patch("subprocess.run") as mock_run:
+        assert PasteSimulator("unknown", _make_config()).type_text("hi") is False
+        mock_run.assert_not_called()
@@ -827,6 +827,17 @@ class TestHistoryManager:
         assert stats['by_language']['en'] == 2
         assert stats['by_language']['es'] == 1
 
+    def test_hash_audio_matches_tobytes_digest(self):
+        """Audio hashes stay byte-for-byte compatible, including for strided arrays."""
+        import hashlib
+
+        from whisper_aloud.persistence import HistoryManager
+
+        audio = np.linspace(-1.0, 1.0, 4000, dtype=np.float32)
+        for samples in (audio, audio[::2]):
+            expected = hashlib.sha256(samples.tobytes()).hexdigest()
+            assert HistoryManager._hash_audio(samples) == expected
+
 
 class TestHistoryManagerExport:
     """Test HistoryManager export functionality."""
@@ -930,6 +941,15 @@ class TestHistoryManagerExport:
         assert "[" in content  # Timestamp markers
 
 
+def test_persistence_package_lists_lazy_exports():
+    """dir() on the persistence package shows lazy exports before they are imported."""
+    import whisper_aloud.persistence as persistence
+
+    names = dir(persistence)
+    assert {"AudioArchive", "HistoryManager", "HistoryEntry", "TranscriptionDatabase"} <= set(names)
+    assert names == sorted(names)
+
+
 class TestAudioArchive:
     """Test audio archive functionality."""
 
@@ -954,6 +974,26 @@ class TestAudioArchive:
         """Sample audio hash."""
         return "a" * 64  # SHA256 hash is 64 hex chars
 
+    def test_module_import_defers_soundfile(self):
+        """Importing the archive module doesn't load soundfile; save() does."""
+        import os
+        import subprocess
+        import sys
+
+        import whisper_aloud
+
+        src_dir = os.path.dirname(os.path.dirname(whisper_aloud.__file__))
+        code = (
+            "import sys; import whisper_aloud.persistence.audio_archive; "
+            "print('soundfile' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+        assert result.stdout.strip() == "False"
+
     def test_archive_creation(self, tmp_path):
         """Test that archive directory is created."""
         archive_path = tmp_path / "audio_archive"
@@ -1004,6 +1044,18 @@ class TestAudioArchive:
         file_path = archive.save(audio, sample_rate, sample_hash)
         assert file_path.exists()
 
+    def test_save_audio_clipping_leaves_caller_array_untouched(self, archive, sample_hash):
+        """Clipping happens on a copy; the stored samples are clipped to [-1, 1]."""
+        import soundfile as sf
+
+        audio = np.array([0.5, 1.5, -1.5, 0.0], dtype=np.float32)
+        file_path = archive.save(audio, 16000, sample_hash)
+
+        np.testing.assert_array_equal(audio, [0.5, 1.5, -1.5, 0.0])
+        stored, _ = sf.read(str(file_path), dtype="float32")
+        assert stored.max() <= 1.0 and stored.min() >= -1.0
+        assert stored[1] == pytest.approx(1.0, abs=1e-4)
+
     def test_save_audio_type_conversion(self, archive, sample_hash):
         """Test that audio type conversion works."""
         # Create audio with int16 type
@@ -1049,6 +1101,18 @@ class TestAudioArchive:
         if not list(parent_dir.glob("*")):
             assert not parent_dir.exists()
 
+    def test_size_and_count_scan_nested_flac_files_only(self, archive):
+        """get_size()/get_file_count() walk every subdirectory and count only .flac files."""
+        nested = archive.archive_path / "2024" / "01"
+        nested.mkdir(parents=True)
+        (nested / "a.flac").write_bytes(b"x" * 10)
+        (archive.archive_path / "b.flac").write_bytes(b"x" * 5)
+        (nested / "notes.txt").write_bytes(b"x" * 100)
+        (archive.archive_path / "dir.flac").mkdir()
+
+        assert archive.get_file_count() == 2
+        assert archive.get_size() == 15
+
     def test_cleanup_orphans(self, archive, sample_audio, db):
         """Test cleanup of orphaned audio files."""
         audio, sample_rate = sample_audio
@@ -1080,6 +1144,43 @@ class TestAudioArchive:
         assert file_path_1.exists()  # Still referenced
         assert not file_path_2.exists()  # Orphaned, deleted
 
+    def test_cleanup_orphans_counts_only_successful_deletes(self, archive, db):
+        """Every unreferenced file is deleted; failed deletes are not counted."""
+        import os
+        from unittest.mock import patch
+
+        month = archive.archive_path / "2024" / "01"
+        month.mkdir(parents=True)
+        orphans = [month / f"{i:016x}.flac" for i in range(20)]
+        for path in orphans:
+            path.write_bytes(b"flac")
+
+        real_unlink = os.unlink
+
+        def unlink(path):
+            if str(path) == str(orphans[0]):
+                raise PermissionError("read-only")
+            real_unlink(path)
+
+        with patch("whisper_aloud.persistence.audio_archive.os.unlink", side_effect=unlink):
+            assert archive.cleanup_orphans(db) == 19
+        assert [p for p in orphans if p.exists()] == [orphans[0]]
+
+    def test_cleanup_orphans_removes_emptied_directories(self, archive, db):
+        """Month/year directories left empty by orphan deletion are removed."""
+        orphan_month = archive.archive_path / "2023" / "12"
+        orphan_month.mkdir(parents=True)
+        for i in range(3):
+            (orphan_month / f"{i:016x}.flac").write_bytes(b"flac")
+        kept_month = archive.archive_path / "2024" / "01"
+        kept_month.mkdir(parents=True)
+        (kept_month / "notes.txt").write_text("not audio")
+
+        assert archive.cleanup_orphans(db) == 3
+        assert not (archive.archive_path / "2023").exists()
+        assert kept_month.is_dir()
+        assert archive.archive_path.is_dir()
+
     def test_get_size(self, archive, sample_audio):
         """Test getting archive size."""
         audio, sample_rate = sample_audio